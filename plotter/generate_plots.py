@@ -6,8 +6,9 @@ import sys
 from pathlib import Path
 
 import click
+import matplotlib
 
-from transit_plotter.generator import generate_all
+from transit_plotter.generator import CACHE_DIR, LOG_FORMAT, SUMMARY_CSV_FILE, find_csv_files, generate_all
 
 
 def setup_logging(verbose: bool) -> None:
@@ -15,7 +16,7 @@ def setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
-        format="%(levelname)s: %(message)s",
+        format=LOG_FORMAT,
         stream=sys.stderr,
     )
 
@@ -48,6 +49,12 @@ def setup_logging(verbose: bool) -> None:
     default=150,
     help="Plot resolution in DPI.",
 )
+@click.option(
+    "--compress-level",
+    type=click.IntRange(0, 9),
+    default=1,
+    help="PNG compression level (0-9). Higher values give smaller files but slower encoding.",
+)
 @click.option(
     "--skip-fitting",
     is_flag=True,
@@ -58,6 +65,25 @@ def setup_logging(verbose: bool) -> None:
     is_flag=True,
     help="Regenerate plots even if they already exist.",
 )
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help="Cache parsed light curves to speed up re-runs.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help=f"Directory for the parsed light curve cache. Defaults to {CACHE_DIR} in the input directory.",
+)
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of files processed in parallel. Defaults to the number of CPUs.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -74,8 +100,12 @@ def main(
     output_dir: Path,
     files: tuple[str, ...],
     dpi: int,
+    compress_level: int,
     skip_fitting: bool,
     force: bool,
+    use_cache: bool,
+    cache_dir: Path | None,
+    workers: int | None,
     verbose: bool,
     dry_run: bool,
 ) -> None:
@@ -99,27 +129,67 @@ def main(
         uv run python generate_plots.py -i my_data -o my_plots --dpi 300
     """
     setup_logging(verbose)
-    logger = logging.getLogger(__name__)
+    matplotlib.use("Agg")
+    _run(
+        input_dir=input_dir,
+        output_dir=output_dir,
+        files=files,
+        dpi=dpi,
+        compress_level=compress_level,
+        skip_fitting=skip_fitting,
+        force=force,
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        workers=workers,
+        dry_run=dry_run,
+    )
+
+
+def _run(
+    input_dir: Path,
+    output_dir: Path,
+    files: tuple[str, ...] = (),
+    dpi: int = 150,
+    compress_level: int = 1,
+    skip_fitting: bool = False,
+    force: bool = False,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+    workers: int | None = None,
+    dry_run: bool = False,
+) -> None:
+    """Run the CLI without Click's parsing layer or logging setup.
+
+    Intended for tests and batch scripts that call the generator repeatedly.
+    """
+    file_list = list(files) if files else None
 
+    # Only list the selected files: no file is opened in dry-run mode
     if dry_run:
         click.echo(f"Files that would be processed from {input_dir}:")
+        for filepath in find_csv_files(input_dir, file_list):
+            click.echo(f"  {filepath.name}")
+        return
 
-    file_list = list(files) if files else None
+    # The output directory is served as is, so the cache stays next to the input data
+    if use_cache and cache_dir is None:
+        cache_dir = input_dir / CACHE_DIR
 
     records = generate_all(
         data_dir=input_dir,
         output_dir=output_dir,
         files=file_list,
         dpi=dpi,
+        compress_level=compress_level,
         skip_fitting=skip_fitting,
-        dry_run=dry_run,
         force=force,
+        cache_dir=cache_dir if use_cache else None,
+        workers=workers,
     )
 
-    if not dry_run:
-        click.echo(f"\nGenerated {len(records)} transit plots in {output_dir}")
-        if records:
-            click.echo(f"Summary saved to {output_dir / 'transits.csv'}")
+    click.echo(f"\nGenerated {len(records)} transit plots in {output_dir}")
+    if records:
+        click.echo(f"Summary saved to {output_dir / SUMMARY_CSV_FILE}")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 # Paths relative to the tests directory
@@ -27,13 +28,20 @@ def sample_simulated_file_2(data_dir: Path) -> Path:
     return data_dir / "kepler2002b.csv"
 
 
-@pytest.fixture
-def transit_summary_csv(data_dir: Path) -> Path:
-    """Path to the reference transits.csv."""
-    return data_dir / "reference_transits.csv"
+def _read_reference_csv(name: str) -> pd.DataFrame:
+    path = TEST_DATA_DIR / name
+    if not path.exists():
+        pytest.skip(f"Reference {name} not found")
+    return pd.read_csv(path)
 
 
-@pytest.fixture
-def light_curves_csv(data_dir: Path) -> Path:
-    """Path to the reference curves.csv."""
-    return data_dir / "reference_curves.csv"
+@pytest.fixture(scope="session")
+def ref_transits_df() -> pd.DataFrame:
+    """Reference transits.csv, parsed once per test session. Do not modify."""
+    return _read_reference_csv("reference_transits.csv")
+
+
+@pytest.fixture(scope="session")
+def ref_curves_df() -> pd.DataFrame:
+    """Reference curves.csv, parsed once per test session. Do not modify."""
+    return _read_reference_csv("reference_curves.csv")
@@ -5,7 +5,17 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from transit_plotter.data_loader import get_file_type, load_light_curve
+from transit_plotter.data_loader import (
+    get_file_type,
+    load_header_cache,
+    load_light_curve,
+    load_light_curves,
+    read_header,
+    read_header_cached,
+    read_time_range,
+    save_header_cache,
+)
+from transit_plotter.types import TransitParams
 
 
 class TestGetFileType:
@@ -37,6 +47,26 @@ class TestLoadLightCurve:
         assert flux.mean() == pytest.approx(1.0, rel=0.01)
         assert 0.9 < flux.min() <= flux.max() < 1.1
 
+    def test_missing_flux_value_is_nan(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "gaps.csv"
+        filepath.write_text('"Type: Simulacion"\nTiempo [BJDS],Flujo\n100.0,1.0\n100.1,\n100.2,0.99\n')
+
+        time, flux, _, _ = load_light_curve(filepath)
+
+        assert time.tolist() == [100.0, 100.1, 100.2]
+        assert np.isnan(flux[1])
+
+    def test_crlf_header_is_parsed(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "crlf.csv"
+        filepath.write_bytes(
+            b'"Type: Simulacion"\r\n"Orbit Period (days): 2.5"\r\nTiempo [BJDS],Flujo\r\n100.0,1.0\r\n'
+        )
+
+        _, _, params, data_type = load_light_curve(filepath)
+
+        assert data_type == "simulated"
+        assert params.Periodo_orbital_d == pytest.approx(2.5)
+
     def test_invalid_file_raises_value_error(self, tmp_path: Path) -> None:
         invalid_file = tmp_path / "invalid.csv"
         invalid_file.write_text("invalid content")
@@ -45,25 +75,109 @@ class TestLoadLightCurve:
             load_light_curve(invalid_file)
 
 
-REQUIRED_PARAMS = [
-    "Periodo_orbital_d",
-    "Epoca_BJDS",
-    "Radio_Planeta_R_star",
-    "Semieje_a_R_star",
-    "Coeficiente_LD_u1",
-    "Coeficiente_LD_u2",
-]
+class TestLoadLightCurves:
+    def test_matches_sequential_loads(
+        self, sample_simulated_file: Path, sample_simulated_file_2: Path
+    ) -> None:
+        paths = [sample_simulated_file, sample_simulated_file_2]
+
+        results = load_light_curves(paths, max_workers=2)
+
+        assert len(results) == len(paths)
+        for path, (time, flux, params, data_type) in zip(paths, results):
+            expected = load_light_curve(path)
+            np.testing.assert_array_equal(time, expected[0])
+            np.testing.assert_array_equal(flux, expected[1])
+            assert params == expected[2]
+            assert data_type == expected[3]
+
+
+class TestReadHeader:
+    def test_load_with_header_matches_full_load(self, sample_simulated_file: Path) -> None:
+        header = read_header(sample_simulated_file)
+        time, flux, params, data_type = load_light_curve(sample_simulated_file)
+
+        loaded = load_light_curve(sample_simulated_file, header=header)
+
+        np.testing.assert_array_equal(loaded[0], time)
+        np.testing.assert_array_equal(loaded[1], flux)
+        assert loaded[2] == params == header.params
+        assert loaded[3] == data_type == header.file_type
+
+    def test_missing_data_header_raises_value_error(self, tmp_path: Path) -> None:
+        invalid_file = tmp_path / "invalid.csv"
+        invalid_file.write_text("invalid content")
+
+        with pytest.raises(ValueError):
+            read_header(invalid_file)
+
+
+class TestReadTimeRange:
+    def test_matches_full_load(self, sample_simulated_file: Path) -> None:
+        time, _, _, _ = load_light_curve(sample_simulated_file)
+
+        assert read_time_range(sample_simulated_file) == (time.min(), time.max(), len(time))
+
+    def test_blank_and_comment_lines_are_not_rows(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "blank.csv"
+        filepath.write_text(
+            '"Type: Simulacion"\nTiempo [BJDS],Flujo\n100.0,1.0\n\n# gap\n100.1,0.99\n100.2,1.0\n\n'
+        )
+        time, _, _, _ = load_light_curve(filepath)
+
+        assert read_time_range(filepath) == (100.0, 100.2, len(time)) == (100.0, 100.2, 3)
+
+    def test_unsorted_rows_give_min_and_max(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "unsorted.csv"
+        filepath.write_text('"Type: Simulacion"\nTiempo [BJDS],Flujo\n100.1,1.0\n100.2,0.99\n100.0,1.0\n')
+
+        assert read_time_range(filepath) == (100.0, 100.2, 3)
+
+
+# Header key -> (param name, value); the values all differ from the TransitParams defaults
+REQUIRED_PARAMS = {
+    "Orbit Period (days)": ("Periodo_orbital_d", 3.5),
+    "Transit Epoch (BJD)": ("Epoca_BJDS", 2455000.25),
+    "Planet Radius (R_planet/R_star)": ("Radio_Planeta_R_star", 0.123),
+    "Planet Semi-major Axis (a/R_star)": ("Semieje_a_R_star", 9.5),
+    "Planet Inclination (deg)": ("Inc_planeta_deg", 87.5),
+    "Limb Darkening Coeff (u1)": ("Coeficiente_LD_u1", 0.45),
+    "Limb Darkening Coeff (u2)": ("Coeficiente_LD_u2", 0.25),
+}
+_REQUIRED_HEADER = {key: value for key, (_, value) in REQUIRED_PARAMS.items()}
+
+
+def _write_simulated_file(filepath: Path, header: dict[str, float]) -> Path:
+    lines = ['"Type: Simulacion"', *(f'"{key}: {value}"' for key, value in header.items())]
+    filepath.write_text("\n".join([*lines, "Tiempo [BJDS],Flujo", "100.0,1.0", ""]))
+    return filepath
 
 
 class TestSimulatedParams:
     @pytest.fixture
-    def params(self, sample_simulated_file: Path) -> dict:
+    def params(self, sample_simulated_file: Path) -> TransitParams:
         _, _, params, _ = load_light_curve(sample_simulated_file)
         return params
 
-    @pytest.mark.parametrize("param_name", REQUIRED_PARAMS)
-    def test_required_params_present(self, params: dict, param_name: str) -> None:
-        assert param_name in params
+    @pytest.mark.parametrize(("param_name", "value"), REQUIRED_PARAMS.values())
+    def test_required_params_present(self, tmp_path: Path, param_name: str, value: float) -> None:
+        filepath = _write_simulated_file(tmp_path / "params.csv", _REQUIRED_HEADER)
+
+        _, _, params, _ = load_light_curve(filepath)
+
+        assert getattr(TransitParams(), param_name) != value
+        assert getattr(params, param_name) == pytest.approx(value)
+
+    @pytest.mark.parametrize(
+        ("key", "param_name"), [(key, name) for key, (name, _) in REQUIRED_PARAMS.items()]
+    )
+    def test_missing_param_keeps_default(self, tmp_path: Path, key: str, param_name: str) -> None:
+        header = {k: v for k, v in _REQUIRED_HEADER.items() if k != key}
+        filepath = _write_simulated_file(tmp_path / "params.csv", header)
+
+        _, _, params, _ = load_light_curve(filepath)
+
+        assert getattr(params, param_name) == getattr(TransitParams(), param_name)
 
     @pytest.mark.parametrize(
         ("param_name", "expected", "rel_tolerance"),
@@ -78,14 +192,14 @@ class TestSimulatedParams:
         ],
     )
     def test_corot1b_param_values(
-        self, params: dict, param_name: str, expected: float, rel_tolerance: float
+        self, params: TransitParams, param_name: str, expected: float, rel_tolerance: float
     ) -> None:
-        assert params[param_name] == pytest.approx(expected, rel=rel_tolerance)
+        assert getattr(params, param_name) == pytest.approx(expected, rel=rel_tolerance)
 
 
 class TestKepler2002bParams:
     @pytest.fixture
-    def params(self, sample_simulated_file_2: Path) -> dict:
+    def params(self, sample_simulated_file_2: Path) -> TransitParams:
         _, _, params, _ = load_light_curve(sample_simulated_file_2)
         return params
 
@@ -97,9 +211,91 @@ class TestKepler2002bParams:
         ],
     )
     def test_kepler2002b_param_values(
-        self, params: dict, param_name: str, expected: float, rel_tolerance: float
+        self, params: TransitParams, param_name: str, expected: float, rel_tolerance: float
     ) -> None:
-        assert params[param_name] == pytest.approx(expected, rel=rel_tolerance)
+        assert getattr(params, param_name) == pytest.approx(expected, rel=rel_tolerance)
+
+    def test_has_epoch(self, params: TransitParams) -> None:
+        assert params.Epoca_BJDS is not None
+
+
+class TestLightCurveCache:
+    def test_cached_load_matches_parsed_file(self, sample_simulated_file: Path, tmp_path: Path) -> None:
+        expected = load_light_curve(sample_simulated_file)
+
+        load_light_curve(sample_simulated_file, cache_dir=tmp_path)
+        time, flux, params, data_type = load_light_curve(sample_simulated_file, cache_dir=tmp_path)
+
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+        np.testing.assert_array_equal(time, expected[0])
+        np.testing.assert_array_equal(flux, expected[1])
+        assert params == expected[2]
+        assert data_type == expected[3]
+
+    def test_modified_file_replaces_cache_entry(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "curve.csv"
+        cache_dir = tmp_path / "cache"
+        filepath.write_text('"Type: Simulacion"\nTiempo [BJDS],Flujo\n100.0,1.0\n')
+        load_light_curve(filepath, cache_dir=cache_dir)
+
+        filepath.write_text('"Type: Simulacion"\nTiempo [BJDS],Flujo\n100.0,1.0\n100.1,0.99\n')
+        time, _, _, _ = load_light_curve(filepath, cache_dir=cache_dir)
+
+        assert len(time) == 2
+        assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    def test_unwritable_cache_dir_still_loads(self, sample_simulated_file: Path, tmp_path: Path) -> None:
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        expected = load_light_curve(sample_simulated_file)
+
+        with pytest.warns(UserWarning, match="Not caching light curves"):
+            time, flux, params, _ = load_light_curve(sample_simulated_file, cache_dir=blocker / "cache")
+
+        np.testing.assert_array_equal(time, expected[0])
+        np.testing.assert_array_equal(flux, expected[1])
+        assert params == expected[2]
+
+
+class TestHeaderCache:
+    def test_cached_header_survives_reload(self, sample_simulated_file: Path, tmp_path: Path) -> None:
+        cache: dict = {}
+        header = read_header_cached(sample_simulated_file, cache)
+        save_header_cache(tmp_path, cache)
+
+        cached = read_header_cached(sample_simulated_file, load_header_cache(tmp_path))
+
+        assert cached == header == read_header(sample_simulated_file)
+
+    def test_unwritable_cache_dir_warns(self, sample_simulated_file: Path, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "not_a_dir"
+        cache_dir.write_text("")
+        cache: dict = {}
+        read_header_cached(sample_simulated_file, cache)
+
+        with pytest.warns(UserWarning, match="Not caching headers"):
+            save_header_cache(cache_dir, cache)
+
+        assert load_header_cache(cache_dir) == {}
+
+    def test_unreadable_cache_file_warns(self, tmp_path: Path) -> None:
+        (tmp_path / "headers.json").write_text("{not json")
+
+        with pytest.warns(UserWarning, match="unreadable header cache"):
+            assert load_header_cache(tmp_path) == {}
+
+    def test_modified_file_is_parsed_again(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "curve.csv"
+        filepath.write_text(
+            '"Type: Simulacion"\n"Orbit Period (days): 2.0"\nTiempo [BJDS],Flujo\n100.0,1.0\n'
+        )
+        cache: dict = {}
+        read_header_cached(filepath, cache)
+
+        filepath.write_text(
+            '"Type: Simulacion"\n"Orbit Period (days): 3.25"\nTiempo [BJDS],Flujo\n100.0,1.0\n'
+        )
+        header = read_header_cached(filepath, cache)
 
-    def test_has_epoch(self, params: dict) -> None:
-        assert "Epoca_BJDS" in params
+        assert header.params.Periodo_orbital_d == pytest.approx(3.25)
+        assert cache["curve.csv"]["params"]["Periodo_orbital_d"] == pytest.approx(3.25)
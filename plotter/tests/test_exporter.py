@@ -8,6 +8,7 @@ import pytest
 from transit_plotter.exporter import (
     LightCurveRecord,
     TransitRecord,
+    finalize_summary_csv,
     save_light_curves_csv,
     save_summary_csv,
 )
@@ -108,6 +109,59 @@ class TestSaveSummaryCsv:
 
         assert not output_path.exists()
 
+    def test_new_trailing_keys_match_full_write(self, tmp_path: Path):
+        records = [make_transit_record(transit_index=i, t0_fitted=100.0 + i) for i in range(1, 5)]
+        incremental_path = tmp_path / "incremental.csv"
+        full_path = tmp_path / "full.csv"
+
+        save_summary_csv(records[:2], incremental_path)
+        save_summary_csv(records[2:], incremental_path)
+        save_summary_csv(records, full_path)
+
+        assert incremental_path.read_text() == full_path.read_text()
+
+    def test_interleaved_keys_merge_in_order(self, tmp_path: Path):
+        output_path = tmp_path / "transits.csv"
+        save_summary_csv([make_transit_record(transit_index=i) for i in (1, 3, 5)], output_path)
+
+        save_summary_csv(
+            [make_transit_record(transit_index=i, t0_fitted=200.0) for i in (4, 2, 3)], output_path
+        )
+
+        df = pd.read_csv(output_path)
+        assert df["transit_index"].tolist() == [1, 2, 3, 4, 5]
+        assert df["t0_fitted"].tolist() == pytest.approx([100.1, 200.0, 200.0, 200.0, 100.1])
+
+    def test_append_mode_deduplicated_on_finalize(self, tmp_path: Path):
+        output_path = tmp_path / "transits.csv"
+        save_summary_csv([make_transit_record(transit_index=2, t0_fitted=100.1)], output_path)
+
+        save_summary_csv([make_transit_record(transit_index=2, t0_fitted=100.2)], output_path, mode="append")
+        save_summary_csv([make_transit_record(transit_index=1)], output_path, mode="append")
+        assert len(pd.read_csv(output_path)) == 3
+
+        finalize_summary_csv(output_path)
+
+        df = pd.read_csv(output_path)
+        assert df["transit_index"].tolist() == [1, 2]
+        assert df.iloc[1]["t0_fitted"] == pytest.approx(100.2, rel=1e-6)
+
+    def test_append_mode_with_mismatched_header_merges(self, tmp_path: Path):
+        output_path = tmp_path / "transits.csv"
+        save_summary_csv([make_transit_record(transit_index=1, t0_fitted=100.1)], output_path)
+        old = pd.read_csv(output_path)
+        old[list(reversed(old.columns))].drop(columns="rms_residuals").to_csv(output_path, index=False)
+
+        save_summary_csv([make_transit_record(transit_index=2, t0_fitted=100.2)], output_path, mode="append")
+        finalize_summary_csv(output_path)
+
+        df = pd.read_csv(output_path)
+        assert df.columns[0] == "file"
+        assert df["transit_index"].tolist() == [1, 2]
+        assert df["t0_fitted"].tolist() == pytest.approx([100.1, 100.2])
+        assert pd.isna(df.iloc[0]["rms_residuals"])
+        assert df.iloc[1]["rms_residuals"] == pytest.approx(0.001)
+
 
 class TestSaveLightCurvesCsv:
     def test_creates_file_with_correct_content(self, tmp_path: Path):
@@ -145,7 +199,7 @@ class TestSaveLightCurvesCsv:
 class TestReferenceData:
     """Tests that verify reference data format and content."""
 
-    TRANSIT_SUMMARY_COLUMNS = [
+    TRANSIT_SUMMARY_COLUMNS = (
         "file",
         "transit_index",
         "t0_expected",
@@ -160,9 +214,9 @@ class TestReferenceData:
         "u1",
         "u2",
         "plot_file",
-    ]
+    )
 
-    LIGHT_CURVES_COLUMNS = [
+    LIGHT_CURVES_COLUMNS = (
         "file",
         "time_min",
         "time_max",
@@ -177,31 +231,23 @@ class TestReferenceData:
         "inc",
         "u1",
         "u2",
-    ]
+    )
 
     @pytest.mark.parametrize(
         ("fixture_name", "expected_cols"),
         [
-            ("transit_summary_csv", TRANSIT_SUMMARY_COLUMNS),
-            ("light_curves_csv", LIGHT_CURVES_COLUMNS),
+            ("ref_transits_df", TRANSIT_SUMMARY_COLUMNS),
+            ("ref_curves_df", LIGHT_CURVES_COLUMNS),
         ],
         ids=["transit_summary", "light_curves"],
     )
-    def test_csv_column_format(self, fixture_name: str, expected_cols: list[str], request):
-        csv_path: Path = request.getfixturevalue(fixture_name)
-        if not csv_path.exists():
-            pytest.skip(f"Reference {csv_path.name} not found")
-
-        df = pd.read_csv(csv_path)
-
-        assert list(df.columns) == expected_cols
+    def test_csv_column_format(self, fixture_name: str, expected_cols: tuple[str, ...], request):
+        df: pd.DataFrame = request.getfixturevalue(fixture_name)
 
-    def test_corot1b_transit_data(self, transit_summary_csv: Path):
-        if not transit_summary_csv.exists():
-            pytest.skip("Reference transits.csv not found")
+        assert tuple(df.columns) == expected_cols
 
-        df = pd.read_csv(transit_summary_csv)
-        corot = df[df["file"] == "Corot1b.csv"]
+    def test_corot1b_transit_data(self, ref_transits_df: pd.DataFrame):
+        corot = ref_transits_df[ref_transits_df["file"] == "Corot1b.csv"]
 
         assert len(corot) == 4
         assert corot["period"].iloc[0] == pytest.approx(2.36, rel=1e-3)
@@ -0,0 +1,57 @@
+"""Tests for the generate_plots CLI."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from generate_plots import _run
+from transit_plotter.generator import CACHE_DIR, SUMMARY_CSV_FILE
+
+
+@pytest.fixture
+def input_dir(tmp_path: Path, sample_simulated_file: Path) -> Path:
+    """Input directory holding a copy of one sample light curve."""
+    path = tmp_path / "data"
+    path.mkdir()
+    shutil.copy(sample_simulated_file, path)
+    return path
+
+
+class TestRun:
+    def test_generates_plots_and_summary(
+        self, input_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        output_dir = tmp_path / "plots"
+
+        _run(input_dir, output_dir, skip_fitting=True, workers=1)
+
+        summary = pd.read_csv(output_dir / SUMMARY_CSV_FILE)
+        assert len(summary) > 0
+        assert all((output_dir / name).exists() for name in summary["plot_file"])
+        assert f"Generated {len(summary)} transit plots" in capsys.readouterr().out
+
+    def test_cache_defaults_to_input_dir(self, input_dir: Path, tmp_path: Path):
+        output_dir = tmp_path / "plots"
+
+        _run(input_dir, output_dir, skip_fitting=True, workers=1)
+
+        assert any((input_dir / CACHE_DIR).iterdir())
+        assert not (output_dir / CACHE_DIR).exists()
+
+    def test_no_cache(self, input_dir: Path, tmp_path: Path):
+        _run(input_dir, tmp_path / "plots", skip_fitting=True, use_cache=False, workers=1)
+
+        assert not (input_dir / CACHE_DIR).exists()
+
+    def test_dry_run_lists_files_only(
+        self, input_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        output_dir = tmp_path / "plots"
+
+        _run(input_dir, output_dir, dry_run=True)
+
+        assert "Corot1b.csv" in capsys.readouterr().out
+        assert not output_dir.exists()
+        assert not (input_dir / CACHE_DIR).exists()
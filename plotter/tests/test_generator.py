@@ -7,6 +7,7 @@ import pytest
 
 from transit_plotter.data_loader import load_light_curve
 from transit_plotter.generator import ModelParams, generate_all, process_file
+from transit_plotter.types import TransitParams
 
 
 class TestModelParams:
@@ -39,7 +40,7 @@ class TestModelParams:
         ],
     )
     def test_defaults_applied(self, param_name: str, expected_default: float):
-        model_params = ModelParams.from_transit_params({})
+        model_params = ModelParams.from_transit_params(TransitParams())
 
         assert getattr(model_params, param_name) == pytest.approx(expected_default, rel=1e-3)
 
@@ -72,6 +73,39 @@ class TestProcessFile:
         assert len(records) == 0
         assert curve is not None
 
+    def test_skip_existing_does_not_load_data(
+        self, sample_simulated_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        _, first_curve = process_file(sample_simulated_file, tmp_path, skip_fitting=True)
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("light curve data should not be loaded")
+
+        monkeypatch.setattr("transit_plotter.generator.load_light_curve", fail_load)
+        records, curve = process_file(sample_simulated_file, tmp_path, skip_fitting=True)
+
+        assert records == []
+        assert curve.time_min == pytest.approx(first_curve.time_min)
+        assert curve.time_max == pytest.approx(first_curve.time_max)
+        assert curve.expected_transits == first_curve.expected_transits
+
+    def test_previously_failed_transits_do_not_load_data(
+        self, sample_simulated_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        process_file(sample_simulated_file, tmp_path, skip_fitting=True)
+        (tmp_path / f"{sample_simulated_file.stem}_transit_002.png").unlink()
+        (tmp_path / "_failed_transits.json").write_text(f'{{"{sample_simulated_file.name}": [2]}}')
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("light curve data should not be loaded")
+
+        monkeypatch.setattr("transit_plotter.generator.load_light_curve", fail_load)
+        records, curve = process_file(sample_simulated_file, tmp_path, skip_fitting=True)
+
+        assert [r.transit_index for r in records] == [2]
+        assert records[0].t0_fitted is None
+        assert curve.found_transits == 1
+
     def test_force_regenerates_plots(self, sample_simulated_file: Path, tmp_path: Path):
         process_file(sample_simulated_file, tmp_path, skip_fitting=True)
         records, _ = process_file(
@@ -129,12 +163,45 @@ class TestGenerateAll:
 
         assert (tmp_path / expected_file).exists()
 
-    def test_dry_run_creates_nothing(self, generate_all_with_file, tmp_path: Path):
+    def test_dry_run_creates_nothing(
+        self, generate_all_with_file, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ):
         records = generate_all_with_file(dry_run=True)
 
         assert records == []
+        assert capsys.readouterr().out == "  Corot1b.csv\n"
         assert not (tmp_path / "transits.csv").exists()
 
+    def test_cache_is_written_to_cache_dir_only(
+        self, generate_all_with_file, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory
+    ):
+        cache_dir = tmp_path_factory.mktemp("cache")
+
+        generate_all_with_file(cache_dir=cache_dir)
+
+        assert len(list(cache_dir.glob("*.npz"))) == 1
+        assert (cache_dir / "headers.json").exists()
+        assert not list(tmp_path.rglob("*.npz"))
+        assert not list(tmp_path.rglob("headers.json"))
+
+    def test_unwritable_cache_dir_is_not_fatal(self, generate_all_with_file, tmp_path: Path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        with pytest.warns(UserWarning, match="Not caching headers"):
+            records = generate_all_with_file(cache_dir=blocker / "cache")
+
+        assert len(records) > 0
+        assert (tmp_path / "transits.csv").exists()
+
+    def test_no_cache_without_cache_dir(self, generate_all_with_file, data_dir: Path, tmp_path: Path):
+        cache_before = sorted(data_dir.rglob("*.npz"))
+
+        generate_all_with_file()
+
+        assert not list(tmp_path.rglob("*.npz"))
+        assert sorted(data_dir.rglob("*.npz")) == cache_before
+
     def test_empty_directory_returns_empty(self, tmp_path: Path):
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
@@ -144,31 +211,30 @@ class TestGenerateAll:
         assert records == []
 
 
-class TestIntegrationWithReference:
-    """Integration tests comparing against reference output."""
+@pytest.fixture(scope="module")
+def reference_data(
+    tmp_path_factory: pytest.TempPathFactory,
+    ref_transits_df: pd.DataFrame,
+    ref_curves_df: pd.DataFrame,
+):
+    """Generate output once for the module and pair it with the reference data."""
+    data_dir = Path(__file__).parent / "data"
+    if not data_dir.exists():
+        pytest.skip("Data directory not found")
 
-    @pytest.fixture
-    def reference_data(
-        self,
-        data_dir: Path,
-        tmp_path: Path,
-        transit_summary_csv: Path,
-        light_curves_csv: Path,
-    ):
-        """Generate output and load reference data for comparison."""
-        if not data_dir.exists():
-            pytest.skip("Data directory not found")
-        if not transit_summary_csv.exists() or not light_curves_csv.exists():
-            pytest.skip("Reference files not found")
+    output_dir = tmp_path_factory.mktemp("reference_output")
+    generate_all(data_dir, output_dir, files=["Corot1b.csv"], skip_fitting=True)
+
+    return {
+        "ref_transits": ref_transits_df,
+        "ref_curves": ref_curves_df,
+        "new_transits": pd.read_csv(output_dir / "transits.csv"),
+        "new_curves": pd.read_csv(output_dir / "curves.csv"),
+    }
 
-        generate_all(data_dir, tmp_path, files=["Corot1b.csv"], skip_fitting=True)
 
-        return {
-            "ref_transits": pd.read_csv(transit_summary_csv),
-            "ref_curves": pd.read_csv(light_curves_csv),
-            "new_transits": pd.read_csv(tmp_path / "transits.csv"),
-            "new_curves": pd.read_csv(tmp_path / "curves.csv"),
-        }
+class TestIntegrationWithReference:
+    """Integration tests comparing against reference output."""
 
     def _filter_corot1b(self, df: pd.DataFrame) -> pd.DataFrame:
         return df[df["file"] == "Corot1b.csv"]
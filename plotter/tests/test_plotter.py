@@ -0,0 +1,95 @@
+"""Tests for plotter module."""
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import matplotlib.image
+import numpy as np
+import pytest
+
+from transit_plotter import plotter
+from transit_plotter.plotter import PngWriter, _render_rgba, transit_figure
+
+
+class TestBackend:
+    def test_import_keeps_matplotlib_backend(self):
+        env = {**os.environ, "MPLBACKEND": "svg"}
+        code = "import transit_plotter, matplotlib; print(matplotlib.get_backend())"
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "svg"
+
+
+class TestRenderRgba:
+    def test_shape_matches_figure_size(self):
+        with transit_figure() as (fig, _, _):
+            rgba = _render_rgba(fig, dpi=50)
+
+        assert rgba.shape == (400, 500, 4)
+
+    def test_matches_savefig_png(self, tmp_path: Path):
+        with transit_figure() as (fig, ax_main, _):
+            ax_main.plot([0, 1], [1, 0])
+            fig.savefig(tmp_path / "expected.png", dpi=50)
+            rgba = _render_rgba(fig, dpi=50)
+
+        expected = matplotlib.image.imread(tmp_path / "expected.png")
+        np.testing.assert_array_equal(rgba, np.round(expected * 255).astype(np.uint8))
+
+
+class TestPngWriter:
+    rgba = np.zeros((4, 4, 4), dtype=np.uint8)
+
+    def test_writes_files_on_close(self, tmp_path: Path):
+        with PngWriter() as writer:
+            writer.submit(tmp_path / "sub" / "image.png", self.rgba, dpi=50, compress_level=1)
+
+        assert matplotlib.image.imread(tmp_path / "sub" / "image.png").shape == (4, 4, 4)
+
+    def test_write_error_is_raised_on_exit(self, tmp_path: Path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        with pytest.raises(NotADirectoryError), PngWriter() as writer:
+            writer.submit(blocker / "image.png", self.rgba, dpi=50, compress_level=1)
+
+    def test_write_error_is_raised_from_close(self, tmp_path: Path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        writer = PngWriter()
+        writer.submit(tmp_path / "ok.png", self.rgba, dpi=50, compress_level=1)
+        writer.submit(blocker / "image.png", self.rgba, dpi=50, compress_level=1)
+
+        with pytest.raises(NotADirectoryError):
+            writer.close()
+        assert (tmp_path / "ok.png").exists()
+
+    def test_submit_blocks_at_max_pending(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        release = threading.Event()
+        monkeypatch.setattr(plotter, "_write_png", lambda *args: release.wait())
+        writer = PngWriter(max_workers=1, max_pending=2)
+        writer.submit(tmp_path / "1.png", self.rgba, dpi=50, compress_level=1)
+        writer.submit(tmp_path / "2.png", self.rgba, dpi=50, compress_level=1)
+
+        submitter = threading.Thread(
+            target=writer.submit, args=(tmp_path / "3.png", self.rgba, 50, 1), daemon=True
+        )
+        submitter.start()
+        submitter.join(timeout=0.2)
+        assert submitter.is_alive()
+
+        release.set()
+        submitter.join(timeout=5)
+        assert not submitter.is_alive()
+        writer.close()
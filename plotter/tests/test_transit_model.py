@@ -0,0 +1,185 @@
+"""Tests for transit_model module."""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transit_plotter.transit_model import (
+    _levenberg_marquardt,
+    batman_model,
+    fit_global_parameters,
+    fit_transit_t0,
+    rolling_median,
+)
+from transit_plotter.types import TransitParams
+
+# Synthetic planet used to generate noiseless light curves
+_PERIOD = 2.36
+_EPOCH = 2454833.0
+_RP = 0.1
+_A = 8.0
+
+
+def synthetic_flux(time: np.ndarray, t0: float = _EPOCH, rp: float = _RP, a: float = _A) -> np.ndarray:
+    """Noiseless Batman light curve of the synthetic planet."""
+    return batman_model(time, t0, _PERIOD, rp, a, 90.0, 0.6, 0.2, 0.0, 90.0, 0.0002, 1)
+
+
+def synthetic_params(rp: float, a: float) -> TransitParams:
+    """Transit parameters of the synthetic planet with the given initial rp and a."""
+    return TransitParams(
+        Periodo_orbital_d=_PERIOD,
+        Epoca_BJDS=_EPOCH,
+        Inc_planeta_deg=90.0,
+        Semieje_a_R_star=a,
+        Radio_Planeta_R_star=rp,
+        Duracion_d=0.12,
+        Coeficiente_LD_u1=0.6,
+        Coeficiente_LD_u2=0.2,
+        exp_time=0.0002,
+        supersample_factor=1,
+    )
+
+
+class TestRollingMedian:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0],
+            [np.nan, 2.0, 7.0, np.nan, 1.0, 8.0, np.nan, np.nan, np.nan, np.nan, 2.0, 8.0],
+            [np.nan, np.nan, 1.0, 2.0, 3.0, 4.0, np.nan],
+            [5.0],
+            [2.0, 1.0],
+            [np.nan, 4.0, 1.0],
+            [3.0, np.nan, 1.0, 2.0],
+            [np.nan, np.nan],
+        ],
+        ids=["plain", "nan-runs", "nan-edges", "len1", "len2", "len3-nan", "len4-nan", "all-nan"],
+    )
+    def test_matches_pandas(self, values: list[float]) -> None:
+        expected = pd.Series(values).rolling(5, center=True, min_periods=1).median().to_numpy()
+
+        np.testing.assert_allclose(rolling_median(np.array(values)), expected, rtol=1e-15, equal_nan=True)
+
+    def test_matches_pandas_on_noisy_curve(self) -> None:
+        values = np.random.default_rng(0).normal(1.0, 1e-3, 500)
+        values[np.random.default_rng(1).choice(500, 40, replace=False)] = np.nan
+
+        expected = pd.Series(values).rolling(5, center=True, min_periods=1).median().to_numpy()
+
+        np.testing.assert_allclose(rolling_median(values), expected, rtol=1e-15, equal_nan=True)
+
+
+class TestLevenbergMarquardt:
+    time = np.linspace(_EPOCH - 0.2, _EPOCH + 0.2, 400)
+
+    def residuals(self, x: np.ndarray) -> np.ndarray:
+        return synthetic_flux(self.time) - synthetic_flux(self.time, rp=x[0], a=x[1])
+
+    def test_converges_to_known_parameters(self) -> None:
+        rp, a = _levenberg_marquardt(
+            self.residuals, np.array([0.09, 8.8]), np.array([0.05, 6.0]), np.array([0.15, 10.0])
+        )
+
+        assert rp == pytest.approx(_RP, rel=1e-4)
+        assert a == pytest.approx(_A, rel=1e-4)
+
+    def test_clamps_to_bounds(self) -> None:
+        lower = np.array([0.11, 6.0])
+        upper = np.array([0.15, 10.0])
+
+        x = _levenberg_marquardt(self.residuals, np.array([0.09, 8.8]), lower, upper)
+
+        assert np.all(x >= lower) and np.all(x <= upper)
+        assert x[0] == pytest.approx(0.11)
+
+    def test_singular_jacobian_returns_initial_parameters(self) -> None:
+        flat_flux = np.ones_like(self.time)
+        x0 = np.array([0.1, 8.0])
+
+        # Far out of transit the model is flat, so the residuals depend on neither parameter
+        x = _levenberg_marquardt(
+            lambda x: flat_flux - synthetic_flux(self.time + 1.0, rp=x[0], a=x[1]),
+            x0,
+            np.array([0.05, 6.0]),
+            np.array([0.15, 10.0]),
+        )
+
+        np.testing.assert_array_equal(x, x0)
+
+    def test_non_finite_initial_residuals_raise(self) -> None:
+        with pytest.raises(ValueError, match="Non-finite"):
+            _levenberg_marquardt(
+                lambda x: np.full(3, np.nan), np.array([0.1, 8.0]), np.zeros(2), np.full(2, 10.0)
+            )
+
+
+class TestFitGlobalParameters:
+    expected_t0s = _EPOCH + _PERIOD * np.arange(3)
+    windows = tuple(np.linspace(t0 - 0.3, t0 + 0.3, 600) for t0 in expected_t0s)
+    time = np.concatenate(windows)
+
+    def test_recovers_known_parameters(self) -> None:
+        flux = synthetic_flux(self.time)
+
+        rp, a = fit_global_parameters(self.time, flux, synthetic_params(0.095, 8.4), self.expected_t0s)
+
+        assert rp == pytest.approx(_RP, rel=1e-3)
+        assert a == pytest.approx(_A, rel=1e-3)
+
+    def test_recovers_parameters_from_shifted_transits(self) -> None:
+        shifts = [0.004, -0.006, 0.002]
+        flux = np.concatenate(
+            [synthetic_flux(t, t0 + shift) for t, t0, shift in zip(self.windows, self.expected_t0s, shifts)]
+        )
+
+        rp, a = fit_global_parameters(self.time, flux, synthetic_params(0.095, 8.4), self.expected_t0s)
+
+        assert rp == pytest.approx(_RP, rel=1e-3)
+        assert a == pytest.approx(_A, rel=1e-3)
+
+    @pytest.mark.parametrize(("rp_factor", "a_factor"), [(1.14, 0.87), (0.87, 1.14)])
+    def test_recovers_parameters_from_noisy_data_near_bounds(self, rp_factor: float, a_factor: float) -> None:
+        # The truth lies just inside the +-15% bounds around the initial values
+        shifts = [0.004, -0.006, 0.002]
+        flux = np.concatenate(
+            [synthetic_flux(t, t0 + shift) for t, t0, shift in zip(self.windows, self.expected_t0s, shifts)]
+        )
+        flux += np.random.default_rng(0).normal(0.0, 5e-4, len(flux))
+        params = synthetic_params(_RP * rp_factor, _A * a_factor)
+
+        rp, a = fit_global_parameters(self.time, flux, params, self.expected_t0s)
+
+        assert rp == pytest.approx(_RP, rel=5e-3)
+        assert a == pytest.approx(_A, rel=5e-3)
+
+    def test_flat_flux_shrinks_planet_within_bounds(self) -> None:
+        flux = np.ones_like(self.time)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            rp, a = fit_global_parameters(self.time, flux, synthetic_params(0.095, 8.4), self.expected_t0s)
+
+        assert rp == pytest.approx(0.095 * 0.85)
+        assert 8.4 * 0.85 <= a <= 8.4 * 1.15
+
+
+class TestFitTransitT0:
+    time = np.linspace(_EPOCH - 0.3, _EPOCH + 0.3, 600)
+
+    @pytest.mark.parametrize("shift", [0.0, 0.004, -0.0065])
+    def test_recovers_injected_shift(self, shift: float) -> None:
+        flux = synthetic_flux(self.time, _EPOCH + shift)
+
+        fitted = fit_transit_t0(self.time, flux, synthetic_params(_RP, _A), _RP, _A, _EPOCH)
+
+        assert fitted is not None
+        assert fitted.t0 - _EPOCH == pytest.approx(shift, abs=1e-8)
+
+    def test_constant_flux_returns_none(self) -> None:
+        flux = np.ones_like(self.time)
+
+        with pytest.warns(UserWarning, match="Constant flux"):
+            assert fit_transit_t0(self.time, flux, synthetic_params(_RP, _A), _RP, _A, _EPOCH) is None
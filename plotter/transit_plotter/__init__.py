@@ -1,6 +1,6 @@
 """Transit plotter package for generating exoplanet transit light curve plots."""
 
-from transit_plotter.data_loader import load_light_curve
+from transit_plotter.data_loader import load_light_curve, load_light_curves, read_header
 from transit_plotter.exporter import TransitRecord, save_summary_csv
 from transit_plotter.generator import generate_all, process_file
 from transit_plotter.plotter import plot_transit
@@ -17,6 +17,8 @@ __all__ = [
     "FittedTransit",
     "TransitRecord",
     "load_light_curve",
+    "load_light_curves",
+    "read_header",
     "batman_model",
     "calculate_expected_transit_times",
     "fit_global_parameters",
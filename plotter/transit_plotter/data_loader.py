@@ -1,24 +1,48 @@
 """Data loading utilities for transit light curve CSV files."""
 
+import io
+import json
+import mmap
+import os
+import re
 import warnings
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Callable
+from typing import BinaryIO
 
 import numpy as np
-import pandas as pd
-
-from transit_plotter.types import (
-    DEFAULT_ECC,
-    DEFAULT_EXP_TIME,
-    DEFAULT_INC,
-    DEFAULT_SUPERSAMPLE,
-    DEFAULT_U1,
-    DEFAULT_U2,
-    DEFAULT_W,
-    TransitParams,
-)
 
-ENCODINGS = ("utf-8", "latin-1")
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional: faster parsing of the numeric data
+    pa = pa_csv = None
+
+from transit_plotter.types import TransitParams
+
+# Parsed headers, stored next to the light curve cache
+HEADER_CACHE_FILE = "headers.json"
+
+# Bytes searched for the data header before giving up
+MAX_HEADER_BYTES = 1 << 20
+
+# Bytes read at a time when scanning the data rows
+READ_BLOCK_BYTES = 1 << 20
+
+# Column header line that separates the metadata header from the numeric data
+_DATA_HEADER_RE = re.compile(rb"Tiempo \[BJDS\][,\t]Flujo")
+# Time value of a data row; blank and comment lines do not match
+_DATA_ROW_RE = re.compile(rb"^[ \t]*([^\s,#][^\s,#]*)", re.MULTILINE)
+# One "key: value" pair per header line, optionally wrapped in double quotes. The
+# groups exclude the surrounding blanks and quotes, so findall yields clean pairs.
+_HEADER_RE = re.compile(
+    r'^[ \t]*"?[ \t]*(?P<key>[^:\r\n]*?)[ \t]*:[ \t"]*(?P<value>[^\r\n]*?)[ \t"]*\r?$', re.MULTILINE
+)
 
 # Parameter mappings: header key pattern -> (param_name, converter)
 _COMMON_PARAMS: dict[str, tuple[str, Callable]] = {
@@ -66,134 +90,425 @@ _REAL_PARAMS: dict[str, tuple[str, Callable]] = {
     "Star logg": ("logg_star", float),
 }
 
-_SIMULATED_DEFAULTS: dict[str, float | int] = {
-    "ecc": DEFAULT_ECC,
-    "w_deg": DEFAULT_W,
-}
 
-_REAL_DEFAULTS: dict[str, float | int] = {
-    "ecc": DEFAULT_ECC,
-    "w_deg": DEFAULT_W,
-    "exp_time": DEFAULT_EXP_TIME,
-    "supersample_factor": DEFAULT_SUPERSAMPLE,
-    "Coeficiente_LD_u1": DEFAULT_U1,
-    "Coeficiente_LD_u2": DEFAULT_U2,
-    "Inc_planeta_deg": DEFAULT_INC,
-}
+def _compile_param_patterns(param_mapping: dict[str, tuple[str, Callable]]) -> re.Pattern[str]:
+    """Compile all header key patterns of a mapping into a single regex alternation.
 
+    Longer patterns are tried first, so a specific pattern wins over a shorter one
+    matching at the same position.
+    """
+    patterns = sorted(param_mapping, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+_SIMULATED_PATTERNS = _compile_param_patterns(_SIMULATED_PARAMS)
+_REAL_PATTERNS = _compile_param_patterns(_REAL_PARAMS)
 
-def _read_with_encoding_fallback(filepath: Path) -> list[str]:
-    """Read file lines trying multiple encodings."""
-    for encoding in ENCODINGS:
-        try:
-            with open(filepath, encoding=encoding) as f:
-                return f.readlines()
-        except UnicodeDecodeError:
-            if encoding == ENCODINGS[-1]:
-                raise
-            warnings.warn(f"{encoding.upper()} decode error in '{filepath}', trying next encoding")
-    raise IOError(f"Could not read file '{filepath}'")
+
+@dataclass
+class LightCurveHeader:
+    """Metadata parsed from the header section of a light curve file."""
+
+    params: TransitParams
+    file_type: str
+    data_offset: int  # Byte offset of the first line after 'Tiempo [BJDS],Flujo'
+
+
+def _decode(raw: bytes, filepath: Path) -> str:
+    """Decode header bytes as UTF-8, falling back to Latin-1.
+
+    Latin-1 maps every byte, so the fallback cannot fail and the bytes are
+    decoded at most twice, without re-reading the file.
+    """
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        warnings.warn(f"UTF-8 decode error in '{filepath}', decoding as Latin-1")
+        return raw.decode("latin-1")
 
 
 def get_file_type(filepath: Path) -> str | None:
     """Determine file type (simulated/real) from header 'Type' field."""
     try:
-        lines = _read_with_encoding_fallback(filepath)
+        with open(filepath, "rb") as f:
+            raw = b"".join(islice(f, 40))
+        file_type, _ = _scan_header(_decode(raw, filepath))
     except (IOError, UnicodeDecodeError):
         return None
+    return file_type
 
-    for line in lines[:40]:
-        cleaned = line.strip().strip('"')
-        if ":" not in cleaned:
-            continue
-        key, value = cleaned.split(":", 1)
-        if key.strip() != "Type":
-            continue
-        value = value.strip().strip('"').lower()
-        if "simulacion" in value:
-            return "simulated"
-        if "real" in value:
-            return "real"
-    return None
 
+def _scan_header(header_text: str) -> tuple[str | None, list[tuple[str, str]]]:
+    """Split header text into (key, value) pairs and detect the file type.
 
-def _find_data_start(lines: list[str]) -> int:
-    """Find the line index where data starts (after 'Tiempo [BJDS],Flujo' header)."""
-    for i, line in enumerate(lines):
-        cleaned = line.strip().strip('"')
-        if "Tiempo [BJDS],Flujo" in cleaned or "Tiempo [BJDS]\tFlujo" in cleaned:
-            return i + 1
-    return -1
+    Returns:
+        Tuple of (file_type, pairs). file_type is "simulated", "real", or None if
+        no 'Type' line identifies it. Keys and values come without surrounding
+        whitespace or double quotes.
+    """
+    pairs = _HEADER_RE.findall(header_text)
+    for key, value in pairs:
+        if key != "Type":
+            continue
+        lowered = value.lower()
+        if "simulacion" in lowered:
+            return "simulated", pairs
+        if "real" in lowered:
+            return "real", pairs
+    return None, pairs
 
 
 def _parse_header(
-    lines: list[str],
+    pairs: list[tuple[str, str]],
     filepath: Path,
     param_mapping: dict[str, tuple[str, Callable]],
-    defaults: dict[str, float | int],
+    param_patterns: re.Pattern[str],
     extract_first_token: bool = False,
 ) -> TransitParams:
     """Parse header parameters from a data file.
 
     Args:
-        lines: File lines to parse.
+        pairs: Header (key, value) pairs from _scan_header.
         filepath: Path to file (for error messages).
         param_mapping: Dict mapping header patterns to (param_name, converter).
-        defaults: Default values to apply after parsing.
+        param_patterns: Compiled alternation of the param_mapping patterns.
         extract_first_token: If True, extract first whitespace-separated token
             before converting (used for real data with units).
     """
-    params: TransitParams = {}
+    params = TransitParams()
 
-    for line in lines:
-        cleaned = line.strip().strip('"')
-        if "Tiempo [BJDS]" in cleaned:
-            break
-        if ":" not in cleaned:
-            continue
-
-        key, value_str = cleaned.split(":", 1)
-        key = key.strip()
-        value_str = value_str.strip().strip('"')
-
-        match = _find_matching_param(key, param_mapping)
+    for key, value_str in pairs:
+        match = _find_matching_param(key, param_mapping, param_patterns)
         if match is None:
             continue
 
         param_name, converter = match
         try:
             if converter == str:
-                params[param_name] = value_str
+                setattr(params, param_name, value_str)
             else:
                 raw = value_str.split()[0] if extract_first_token else value_str
-                params[param_name] = converter(raw)
+                setattr(params, param_name, converter(raw))
         except (ValueError, IndexError):
             warnings.warn(f"Could not convert '{key}': '{value_str}' in '{filepath}'")
 
-    for key, value in defaults.items():
-        params.setdefault(key, value)
-
     return params
 
 
 def _find_matching_param(
-    key: str, param_mapping: dict[str, tuple[str, Callable]]
+    key: str, param_mapping: dict[str, tuple[str, Callable]], param_patterns: re.Pattern[str]
 ) -> tuple[str, Callable] | None:
     """Find a parameter mapping using substring matching."""
-    for pattern, value in param_mapping.items():
-        if pattern in key:
-            return value
-    return None
+    pattern = _match_param_key(param_patterns, key)
+    if pattern is None:
+        return None
+    return param_mapping[pattern]
+
+
+@lru_cache(maxsize=1024)
+def _match_param_key(param_patterns: re.Pattern[str], key: str) -> str | None:
+    """Return the mapping pattern found in a header key, memoized since keys repeat across files."""
+    match = param_patterns.search(key)
+    return None if match is None else match.group(0)
+
+
+def _parse_data(body: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Parse the numeric (time, flux) body of a light curve file.
+
+    pyarrow's multithreaded CSV reader is used when it is installed. Otherwise,
+    or for bodies it rejects (e.g. comment lines), NumPy's parser handles the
+    common case of two well-formed float columns, which avoids building a
+    DataFrame. Bodies NumPy rejects (e.g. empty cells) are parsed with pandas,
+    which tolerates them.
+    """
+    if pa_csv is not None:
+        try:
+            return _parse_data_arrow(body)
+        except pa.ArrowInvalid:
+            pass
+
+    # The data rows are plain ASCII numbers, so Latin-1 decodes them in one pass
+    text = body.decode("latin-1")
+    try:
+        data = np.loadtxt(
+            io.StringIO(text), delimiter=",", comments="#", usecols=(0, 1), dtype=np.float64, ndmin=2
+        )
+        return data[:, 0], data[:, 1]
+    except ValueError:
+        # Imported lazily: pandas is only needed for the irregular bodies NumPy rejects
+        import pandas as pd
+
+        # Explicit dtypes skip type inference; NA filtering stays on for empty cells
+        df = pd.read_csv(
+            io.StringIO(text),
+            sep=",",
+            names=["Tiempo [BJDS]", "Flujo"],
+            usecols=[0, 1],
+            dtype={"Tiempo [BJDS]": np.float64, "Flujo": np.float64},
+            comment="#",
+            skipinitialspace=True,
+            engine="c",
+        )
+        return df["Tiempo [BJDS]"].to_numpy(), df["Flujo"].to_numpy()
+
+
+def _parse_data_arrow(body: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Parse the numeric body with pyarrow. Empty cells become NaN."""
+    table = pa_csv.read_csv(
+        pa.BufferReader(body),
+        read_options=pa_csv.ReadOptions(column_names=["time", "flux"]),
+        parse_options=pa_csv.ParseOptions(delimiter=","),
+        convert_options=pa_csv.ConvertOptions(column_types={"time": pa.float64(), "flux": pa.float64()}),
+    )
+    return table.column("time").to_numpy(), table.column("flux").to_numpy()
+
+
+def _parse_header_text(header_text: str, filepath: Path) -> tuple[TransitParams, str]:
+    """Detect the file type and parse header parameters with the matching mapping."""
+    file_type, pairs = _scan_header(header_text)
+    if file_type == "simulated":
+        params = _parse_header(pairs, filepath, _SIMULATED_PARAMS, _SIMULATED_PATTERNS)
+    else:
+        params = _parse_header(pairs, filepath, _REAL_PARAMS, _REAL_PATTERNS, extract_first_token=True)
+        file_type = "real"
+    return params, file_type
+
+
+def _find_header_end(f: BinaryIO, filepath: Path) -> tuple[bytes, int]:
+    """Locate the 'Tiempo [BJDS],Flujo' line with a single search over the memory-mapped file.
+
+    Only the first MAX_HEADER_BYTES bytes are searched, so files without that
+    line are rejected without being scanned to the end.
+
+    Returns:
+        Tuple of (header_bytes, data_offset): the raw bytes before the data header
+        line and the byte offset of the line after it.
+
+    Raises:
+        ValueError: If no data header line is found within MAX_HEADER_BYTES bytes.
+    """
+    error = ValueError(f"No data header ('Tiempo [BJDS],Flujo') found in '{filepath}'")
+    if os.fstat(f.fileno()).st_size == 0:
+        raise error
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        match = _DATA_HEADER_RE.search(mm, 0, MAX_HEADER_BYTES)
+        if match is None:
+            raise error
+        line_start = mm.rfind(b"\n", 0, match.start()) + 1
+        line_end = mm.find(b"\n", match.end())
+        return mm[:line_start], len(mm) if line_end < 0 else line_end + 1
+
+
+def _read_header(f: BinaryIO, filepath: Path) -> LightCurveHeader:
+    """Parse the header from an open binary file, leaving it positioned at the first data line."""
+    header_bytes, data_offset = _find_header_end(f, filepath)
+    f.seek(data_offset)
+    params, file_type = _parse_header_text(_decode(header_bytes, filepath), filepath)
+    return LightCurveHeader(params=params, file_type=file_type, data_offset=data_offset)
+
 
+@lru_cache(maxsize=128)
+def _read_header_cached(filepath: Path, mtime_ns: int, size: int) -> LightCurveHeader:
+    """Parse a file header once per (path, modification time, size)."""
+    with open(filepath, "rb") as f:
+        return _read_header(f, filepath)
 
-def load_light_curve(filepath: Path) -> tuple[np.ndarray, np.ndarray, TransitParams, str]:
+
+def read_header(filepath: Path) -> LightCurveHeader:
+    """Read and parse only the header section of a light curve file.
+
+    The result can be passed to load_light_curve to skip parsing the header again.
+    Headers are cached in memory until the file is modified; each call returns
+    its own copy.
+
+    Raises:
+        ValueError: If the file has no data header line.
+        IOError: If the file cannot be read.
+    """
+    filepath = Path(filepath)
+    stat = filepath.stat()
+    header = _read_header_cached(filepath, stat.st_mtime_ns, stat.st_size)
+    return replace(header, params=replace(header.params))
+
+
+def load_header_cache(cache_dir: Path) -> dict[str, dict]:
+    """Read the on-disk header cache, or return an empty one if it is missing or unreadable."""
+    cache_path = Path(cache_dir) / HEADER_CACHE_FILE
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except (OSError, ValueError):
+        warnings.warn(f"Ignoring unreadable header cache '{cache_path}'")
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_header_cache(cache_dir: Path, cache: dict[str, dict]) -> None:
+    """Atomically write the header cache to cache_dir.
+
+    The cache only saves time on the next run, so write errors are reported
+    as a warning rather than raised.
+    """
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f"{HEADER_CACHE_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_dir / HEADER_CACHE_FILE)
+    except OSError as e:
+        warnings.warn(f"Not caching headers: cannot write to '{cache_dir}' ({e.strerror})")
+
+
+def read_header_cached(filepath: Path, cache: dict[str, dict]) -> LightCurveHeader:
+    """Read a file header through a cache from load_header_cache.
+
+    Entries are keyed by file name and reused while the file modification time
+    and size are unchanged; otherwise the header is parsed and the entry replaced.
+    """
+    filepath = Path(filepath)
+    stat = filepath.stat()
+    entry = cache.get(filepath.name)
+    if entry is not None and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+        try:
+            return LightCurveHeader(
+                params=TransitParams(**entry["params"]),
+                file_type=entry["file_type"],
+                data_offset=entry["data_offset"],
+            )
+        except (KeyError, TypeError):
+            pass
+
+    header = read_header(filepath)
+    cache[filepath.name] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "params": asdict(header.params),
+        "file_type": header.file_type,
+        "data_offset": header.data_offset,
+    }
+    return header
+
+
+def _line_blocks(f: BinaryIO) -> Iterator[bytes]:
+    """Read the rest of a file in blocks of READ_BLOCK_BYTES or so, each ending at a line end."""
+    pending = b""
+    while block := f.read(READ_BLOCK_BYTES):
+        block = pending + block
+        line_end = block.rfind(b"\n") + 1
+        yield block[:line_end]
+        pending = block[line_end:]
+    yield pending
+
+
+def read_time_range(filepath: Path, header: LightCurveHeader | None = None) -> tuple[float, float, int]:
+    """
+    Read the time span of a light curve without parsing the flux column.
+
+    Only the time values are converted, block by block, so the range is right
+    for unsorted data too. Blank and comment lines are skipped, as the loaders
+    skip them.
+
+    Args:
+        filepath: Path to the CSV file.
+        header: Header from read_header, to avoid parsing it again.
+
+    Returns:
+        Tuple of (min_time, max_time, n_rows).
+
+    Raises:
+        ValueError: If the file has no data rows or they cannot be converted.
+    """
+    time_min = np.inf
+    time_max = -np.inf
+    n_rows = 0
+    with open(filepath, "rb") as f:
+        if header is None:
+            _read_header(f, filepath)
+        else:
+            f.seek(header.data_offset)
+        for block in _line_blocks(f):
+            tokens = _DATA_ROW_RE.findall(block)
+            if not tokens:
+                continue
+            try:
+                times = np.array(tokens).astype(np.float64)
+            except ValueError as e:
+                raise ValueError(f"Error reading time range from '{filepath}': {e}") from e
+            time_min = min(time_min, times.min())
+            time_max = max(time_max, times.max())
+            n_rows += len(times)
+
+    if n_rows == 0:
+        raise ValueError(f"No data rows in '{filepath}'")
+    return float(time_min), float(time_max), n_rows
+
+
+def _cache_path(filepath: Path, cache_dir: Path) -> Path:
+    """Cache file name for a light curve, keyed by the source modification time and size."""
+    stat = filepath.stat()
+    return cache_dir / f"{filepath.stem}-{stat.st_mtime_ns}-{stat.st_size}.npz"
+
+
+def _cached_load(
+    filepath: Path, cache_dir: Path, header: LightCurveHeader | None = None
+) -> tuple[np.ndarray, np.ndarray, TransitParams, str]:
+    """Load a light curve through an on-disk .npz cache of the parsed data."""
+    cache_path = _cache_path(filepath, cache_dir)
+    if cache_path.exists():
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                return (
+                    data["time"],
+                    data["flux"],
+                    TransitParams(**json.loads(str(data["params"]))),
+                    str(data["file_type"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            warnings.warn(f"Ignoring unreadable cache file '{cache_path}'")
+
+    time, flux, params, file_type = _load_light_curve(filepath, header)
+
+    # The cache only saves time on the next run, so a read-only or full data
+    # directory must not stop the file from loading
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{filepath.stem}-*.npz"):
+            if stale.name.rsplit("-", 2)[0] == filepath.stem:
+                stale.unlink(missing_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, time=time, flux=flux, params=json.dumps(asdict(params)), file_type=file_type)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        warnings.warn(f"Not caching light curves: cannot write to '{cache_dir}' ({e.strerror})")
+
+    return time, flux, params, file_type
+
+
+def load_light_curve(
+    filepath: Path,
+    cache_dir: Path | None = None,
+    header: LightCurveHeader | None = None,
+    flux_dtype: type[np.floating] = np.float32,
+) -> tuple[np.ndarray, np.ndarray, TransitParams, str]:
     """Load light curve data from a CSV file.
 
     Args:
         filepath: Path to the CSV file.
+        cache_dir: Optional directory for a cache of parsed light curves. Cache
+            entries are keyed by the file modification time and size, so edited
+            files are parsed again.
+        header: Header previously returned by read_header for this file. If given,
+            only the numeric data is read.
+        flux_dtype: Float type of the returned flux array. Time is always float64,
+            since BJD values need its precision; single precision is plenty for
+            normalized flux and halves its memory traffic.
 
     Returns:
-        Tuple of (time_array, flux_array, parameters_dict, data_type).
+        Tuple of (time_array, flux_array, params, data_type).
         data_type is either "simulated" or "real".
 
     Raises:
@@ -201,34 +516,79 @@ def load_light_curve(filepath: Path) -> tuple[np.ndarray, np.ndarray, TransitPar
         IOError: If the file cannot be read.
     """
     filepath = Path(filepath)
-    lines = _read_with_encoding_fallback(filepath)
+    if cache_dir is not None:
+        time, flux, params, file_type = _cached_load(filepath, Path(cache_dir), header)
+    else:
+        time, flux, params, file_type = _load_light_curve(filepath, header)
 
-    data_start = _find_data_start(lines)
-    if data_start == -1:
-        raise ValueError(f"No data header ('Tiempo [BJDS],Flujo') found in '{filepath}'")
+    time = np.ascontiguousarray(time, dtype=np.float64)
+    flux = np.ascontiguousarray(flux, dtype=flux_dtype)
+    return time, flux, params, file_type
 
-    file_type = get_file_type(filepath)
-    if file_type == "simulated":
-        params = _parse_header(lines, filepath, _SIMULATED_PARAMS, _SIMULATED_DEFAULTS)
-    else:
-        params = _parse_header(
-            lines, filepath, _REAL_PARAMS, _REAL_DEFAULTS, extract_first_token=True
-        )
-        file_type = "real"
+
+def _load_light_curve(
+    filepath: Path, header: LightCurveHeader | None = None
+) -> tuple[np.ndarray, np.ndarray, TransitParams, str]:
+    """Parse a light curve CSV file (see load_light_curve).
+
+    The file is opened once: the end of the header is found on a memory map of
+    the file and the rest of the file is then read in one go as the numeric body.
+    """
+    with open(filepath, "rb") as f:
+        if header is None:
+            header = _read_header(f, filepath)
+        else:
+            f.seek(header.data_offset)
+        body = f.read()
 
     try:
-        df = pd.read_csv(
-            filepath,
-            sep=",",
-            skiprows=data_start,
-            names=["Tiempo [BJDS]", "Flujo"],
-            encoding="utf-8",
-            comment="#",
-            skipinitialspace=True,
-        )
-        time = df["Tiempo [BJDS]"].to_numpy()
-        flux = df["Flujo"].to_numpy()
+        time, flux = _parse_data(body)
     except Exception as e:
         raise ValueError(f"Error loading data from '{filepath}': {e}") from e
 
-    return time, flux, params, file_type
+    return time, flux, header.params, header.file_type
+
+
+def _prefetch(filepath: Path) -> None:
+    """Ask the kernel to start reading a file into the page cache."""
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def load_light_curves(
+    filepaths: list[Path],
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+) -> list[tuple[np.ndarray, np.ndarray, TransitParams, str]]:
+    """Load several light curves in parallel worker processes.
+
+    Results are returned in input order, as from load_light_curve. Where the
+    platform supports it, reads of all files are started in the background
+    first, so the workers find them in the page cache.
+
+    Raises:
+        ValueError: If a file format is invalid.
+        IOError: If a file cannot be read.
+    """
+    filepaths = [Path(p) for p in filepaths]
+    if not filepaths:
+        return []
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if hasattr(os, "posix_fadvise"):
+        with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as prefetcher:
+            list(prefetcher.map(_prefetch, filepaths))
+
+    chunksize = max(1, len(filepaths) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(filepaths))) as executor:
+        return list(
+            executor.map(partial(load_light_curve, cache_dir=cache_dir), filepaths, chunksize=chunksize)
+        )
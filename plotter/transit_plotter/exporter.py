@@ -1,13 +1,15 @@
 """CSV export utilities for transit summary data."""
 
-from dataclasses import dataclass, fields
+import csv
+from collections.abc import Callable
+from dataclasses import Field, dataclass, fields
+from functools import cache
+from itertools import pairwise
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, get_args
 
-import pandas as pd
 
-
-@dataclass
+@dataclass(slots=True)
 class TransitRecord:
     """Data record for a single transit, used for CSV export."""
 
@@ -27,7 +29,7 @@ class TransitRecord:
     plot_file: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class LightCurveRecord:
     """Data record for a light curve file, used for CSV export."""
 
@@ -47,72 +49,220 @@ class LightCurveRecord:
     u2: float
 
 
-def _format_value(value: Any) -> Any:
-    """Format a value for CSV export."""
-    if value is None:
-        return ""
-    if isinstance(value, float):
-        return f"{value:.10g}"
-    return value
+SaveMode = Literal["merge", "append"]
+
+_SUMMARY_KEY_COLS = ["file", "transit_index"]
+_LIGHT_CURVES_KEY_COLS = ["file"]
+
+Row = list[Any]
+
+
+def _is_float_field(field_type: Any) -> bool:
+    """Whether a dataclass field annotation is float or an optional float."""
+    return field_type is float or float in get_args(field_type)
+
+
+@cache
+def _field_names(record_type: type) -> tuple[str, ...]:
+    """Field names of a record dataclass, introspected once per type."""
+    return tuple(f.name for f in fields(record_type))
+
+
+def _cell_source(f: Field) -> str:
+    """Source of the expression formatting one field of record `r` as a CSV cell."""
+    if not _is_float_field(f.type):
+        return f"r.{f.name}"  # csv.writer writes None as an empty cell
+    if type(None) in get_args(f.type):
+        return f'"" if r.{f.name} is None else "%.10g" % r.{f.name}'
+    return f'"%.10g" % r.{f.name}'
+
+
+@cache
+def _row_builder(record_type: type) -> Callable[[Any], Row]:
+    """
+    Generate a function formatting one record as a CSV row, once per record type.
+
+    The field types are known up front, so floats get the %.10g format (and a
+    None check only when optional) with no per-value type dispatch.
+    """
+    cells = ", ".join(_cell_source(f) for f in fields(record_type))
+    namespace: dict[str, Any] = {}
+    # The source is built only from dataclass field names, never from data
+    exec(f"def build_row(r):\n    return [{cells}]\n", namespace)  # noqa: S102
+    return namespace["build_row"]
+
+
+def _format_rows(records: list[Any]) -> list[Row]:
+    """Convert dataclass records to formatted CSV rows in field order."""
+    return list(map(_row_builder(type(records[0])), records))
+
+
+def _row_key(record_type: type, key_cols: list[str]) -> Callable[[Row], tuple]:
+    """Sort/dedup key for rows in field order; integer fields compare numerically."""
+    types = {f.name: f.type for f in fields(record_type)}
+    names = _field_names(record_type)
+    spec = [(names.index(k), int if types[k] is int else str) for k in key_cols]
+    return lambda row: tuple(convert(row[i]) for i, convert in spec)
+
+
+def _read_rows(path: Path, columns: tuple[str, ...]) -> tuple[bool, list[Row]]:
+    """
+    Read CSV rows reordered to the given columns.
+
+    Returns:
+        Tuple of (same_header, rows). Columns missing from the file are left empty.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = [row for row in reader if row]
+    if header == list(columns):
+        return True, rows
+    index = {name: i for i, name in enumerate(header)}
+    return False, [
+        [row[index[c]] if c in index and index[c] < len(row) else "" for c in columns] for row in rows
+    ]
+
+
+def _read_header(path: Path) -> list[str]:
+    """Read the header row of a CSV file."""
+    with open(path, newline="") as f:
+        return next(csv.reader(f), [])
+
 
+def _write_rows(path: Path, columns: tuple[str, ...], rows: list[Row], append: bool = False) -> None:
+    """Write rows to a CSV file, with a header unless appending."""
+    with open(path, "a" if append else "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if not append:
+            writer.writerow(columns)
+        writer.writerows(rows)
 
-def _dataclass_to_row(record: Any) -> dict[str, Any]:
-    """Convert a dataclass instance to a dictionary with formatted values."""
-    return {f.name: _format_value(getattr(record, f.name)) for f in fields(record)}
+
+def _dedup_rows(rows: list[Row], key: Callable[[Row], tuple]) -> list[Row]:
+    """Keep the last row for each key, sorted by key."""
+    latest = {key(row): row for row in rows}
+    return sorted(latest.values(), key=key)
+
+
+def _merge_sorted_rows(existing: list[Row], new: list[Row], key: Callable[[Row], tuple]) -> list[Row] | None:
+    """
+    Merge new rows into existing ones in a single pass; new rows win on equal keys.
+
+    Both lists must be sorted with unique keys. Returns None if the existing rows
+    are not, in which case the caller falls back to a full dedup and sort.
+    """
+    existing_keys = [key(row) for row in existing]
+    if any(a >= b for a, b in pairwise(existing_keys)):
+        return None
+
+    merged = []
+    i = 0
+    for row in new:
+        row_key = key(row)
+        while i < len(existing) and existing_keys[i] < row_key:
+            merged.append(existing[i])
+            i += 1
+        if i < len(existing) and existing_keys[i] == row_key:
+            i += 1
+        merged.append(row)
+    merged.extend(existing[i:])
+    return merged
 
 
 def _save_records_csv(
     records: list[Any],
     output_path: Path,
     key_cols: list[str],
-    read_csv_kwargs: dict[str, Any] | None = None,
+    mode: SaveMode = "merge",
 ) -> None:
     """
     Save dataclass records to a CSV file, merging with existing data.
 
     New records update existing ones based on key columns.
-    Existing records not in the new batch are preserved.
+    Existing records not in the new batch are preserved. When all new keys sort
+    after the existing ones, the rows are appended instead of rewriting the file;
+    otherwise the sorted file is merged with the new rows in a single pass.
+
+    With mode="append" the rows are appended after checking only the existing
+    header; duplicates are left in place until _finalize_records_csv is called.
+    A file with a different header is merged instead, so appended rows always
+    match the header they are written under.
     """
     if not records:
         return
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    new_df = pd.DataFrame([_dataclass_to_row(r) for r in records])
+    record_type = type(records[0])
+    columns = _field_names(record_type)
+    new_rows = _format_rows(records)
+
+    exists = output_path.exists() and output_path.stat().st_size > 0
+    if mode == "append" and (not exists or _read_header(output_path) == list(columns)):
+        _write_rows(output_path, columns, new_rows, append=exists)
+        return
 
-    if output_path.exists():
-        existing_df = pd.read_csv(output_path, **(read_csv_kwargs or {}))
-        merged_df = (
-            pd.concat([existing_df, new_df])
-            .drop_duplicates(subset=key_cols, keep="last")
-            .sort_values(key_cols)
-            .reset_index(drop=True)
-        )
-    else:
-        merged_df = new_df
+    if not exists:
+        _write_rows(output_path, columns, new_rows)
+        return
 
-    merged_df.to_csv(output_path, index=False)
+    key = _row_key(record_type, key_cols)
+    same_header, existing_rows = _read_rows(output_path, columns)
+    new_rows = _dedup_rows(new_rows, key)
+    if same_header and (not existing_rows or max(map(key, existing_rows)) < key(new_rows[0])):
+        _write_rows(output_path, columns, new_rows, append=True)
+        return
 
+    merged = _merge_sorted_rows(existing_rows, new_rows, key)
+    if merged is None:
+        merged = _dedup_rows(existing_rows + new_rows, key)
+    _write_rows(output_path, columns, merged)
 
-def save_summary_csv(records: list[TransitRecord], output_path: Path) -> None:
+
+def _finalize_records_csv(output_path: Path, record_type: type, key_cols: list[str]) -> None:
+    """Deduplicate and sort a CSV file written with mode="append".
+
+    The file is only rewritten when rows were dropped or reordered.
+    """
+    if not output_path.exists():
+        return
+    columns = _field_names(record_type)
+    same_header, rows = _read_rows(output_path, columns)
+    deduped = _dedup_rows(rows, _row_key(record_type, key_cols))
+    if same_header and deduped == rows:
+        return
+    _write_rows(output_path, columns, deduped)
+
+
+def save_summary_csv(records: list[TransitRecord], output_path: Path, mode: SaveMode = "merge") -> None:
     """
     Save transit records to a CSV file, merging with existing data.
 
     New records update existing ones based on (file, transit_index) key.
     Existing records not in the new batch are preserved.
+    With mode="append", call finalize_summary_csv once all records are written.
     """
-    _save_records_csv(
-        records,
-        output_path,
-        key_cols=["file", "transit_index"],
-        read_csv_kwargs={"dtype": {"transit_index": int}},
-    )
+    _save_records_csv(records, output_path, key_cols=_SUMMARY_KEY_COLS, mode=mode)
+
+
+def finalize_summary_csv(output_path: Path) -> None:
+    """Deduplicate a transit summary CSV written in append mode."""
+    _finalize_records_csv(output_path, TransitRecord, _SUMMARY_KEY_COLS)
 
 
-def save_light_curves_csv(records: list[LightCurveRecord], output_path: Path) -> None:
+def save_light_curves_csv(
+    records: list[LightCurveRecord], output_path: Path, mode: SaveMode = "merge"
+) -> None:
     """
     Save light curve records to a CSV file, merging with existing data.
 
     New records update existing ones based on file key.
     Existing records not in the new batch are preserved.
+    With mode="append", call finalize_light_curves_csv once all records are written.
     """
-    _save_records_csv(records, output_path, key_cols=["file"])
+    _save_records_csv(records, output_path, key_cols=_LIGHT_CURVES_KEY_COLS, mode=mode)
+
+
+def finalize_light_curves_csv(output_path: Path) -> None:
+    """Deduplicate a light curves CSV written in append mode."""
+    _finalize_records_csv(output_path, LightCurveRecord, _LIGHT_CURVES_KEY_COLS)
@@ -2,43 +2,63 @@
 
 import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
+import matplotlib
 import numpy as np
-import pandas as pd
-
-from transit_plotter.data_loader import load_light_curve
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from transit_plotter.data_loader import (
+    LightCurveHeader,
+    load_header_cache,
+    load_light_curve,
+    read_header,
+    read_header_cached,
+    read_time_range,
+    save_header_cache,
+)
 from transit_plotter.exporter import (
     LightCurveRecord,
     TransitRecord,
+    finalize_light_curves_csv,
+    finalize_summary_csv,
     save_light_curves_csv,
     save_summary_csv,
 )
-from transit_plotter.plotter import plot_transit
+from transit_plotter.plotter import PngWriter, plot_transit, transit_figure
 from transit_plotter.transit_model import (
     batman_model,
-    calculate_expected_transit_times,
+    expected_transit_times_in_range,
     fit_global_parameters,
     fit_transit_t0,
+    rolling_median,
+    sum_squared_residuals,
 )
-from transit_plotter.types import (
-    DEFAULT_ECC,
-    DEFAULT_EXP_TIME,
-    DEFAULT_INC,
-    DEFAULT_SUPERSAMPLE,
-    DEFAULT_U1,
-    DEFAULT_U2,
-    DEFAULT_W,
-    TransitParams,
-)
+from transit_plotter.types import TransitParams
 
 logger = logging.getLogger(__name__)
 
 FAILED_TRANSITS_FILE = "_failed_transits.json"
+SUMMARY_CSV_FILE = "transits.csv"
+CURVES_CSV_FILE = "curves.csv"
+CACHE_DIR = ".cache"  # Default cache directory name, inside the input data directory
+PRESCAN_THREADS = 8
+LOG_FORMAT = "%(levelname)s: %(message)s"
+
+# Start method of the worker processes. fork is unsafe once the header prescan
+# has started threads, and it stops being the default in Python 3.14.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelParams:
     """Model parameters extracted from transit params with defaults applied."""
 
@@ -55,15 +75,15 @@ class ModelParams:
     @classmethod
     def from_transit_params(cls, params: TransitParams) -> "ModelParams":
         return cls(
-            exp_time=params.get("exp_time", DEFAULT_EXP_TIME),
-            supersample=int(params.get("supersample_factor", DEFAULT_SUPERSAMPLE)),
-            inc=params.get("Inc_planeta_deg", DEFAULT_INC),
-            u1=params.get("Coeficiente_LD_u1", DEFAULT_U1),
-            u2=params.get("Coeficiente_LD_u2", DEFAULT_U2),
-            ecc=params.get("ecc", DEFAULT_ECC),
-            w=params.get("w_deg", DEFAULT_W),
-            rp=params.get("Radio_Planeta_R_star", 0.1),
-            a=params.get("Semieje_a_R_star", 8.0),
+            exp_time=params.exp_time,
+            supersample=int(params.supersample_factor),
+            inc=params.Inc_planeta_deg,
+            u1=params.Coeficiente_LD_u1,
+            u2=params.Coeficiente_LD_u2,
+            ecc=params.ecc,
+            w=params.w_deg,
+            rp=params.Radio_Planeta_R_star,
+            a=params.Semieje_a_R_star,
         )
 
 
@@ -76,6 +96,48 @@ class TransitFitResult:
     rms_residuals: float | None
 
 
+@dataclass
+class TransitWindow:
+    """Data selected for plotting around a single transit."""
+
+    time: np.ndarray
+    flux: np.ndarray
+    t0_fitted: float | None
+
+
+def _init_worker(log_level: int) -> None:
+    """
+    Set up a worker process, which only renders to files.
+
+    Workers do not inherit the logging setup of the parent process, so it is
+    repeated here at the parent's level.
+    """
+    matplotlib.use("Agg")
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+
+
+def _read_header_or_none(filepath: Path, cache: dict[str, dict] | None = None) -> LightCurveHeader | None:
+    """Read a file header, leaving error reporting to the full load in process_file."""
+    try:
+        return read_header(filepath) if cache is None else read_header_cached(filepath, cache)
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+
+def _prescan(csv_files: list[Path], cache_dir: Path | None = None) -> list[LightCurveHeader | None]:
+    """Read all file headers concurrently; header reads are small and I/O bound.
+
+    With a cache_dir, headers of unchanged files are taken from the on-disk header cache.
+    """
+    cache = load_header_cache(cache_dir) if cache_dir is not None else None
+    initial = dict(cache) if cache is not None else None
+    with ThreadPoolExecutor(max_workers=PRESCAN_THREADS) as executor:
+        headers = list(executor.map(partial(_read_header_or_none, cache=cache), csv_files))
+    if cache is not None and cache != initial:
+        save_header_cache(cache_dir, cache)
+    return headers
+
+
 def _load_failed_transits(output_dir: Path) -> dict[str, list[int]]:
     """Load the list of failed transits from JSON file."""
     failed_file = output_dir / FAILED_TRANSITS_FILE
@@ -98,37 +160,43 @@ def _save_failed_transits(output_dir: Path, failed: dict[str, list[int]]) -> Non
 def _find_initial_t0(time: np.ndarray, flux: np.ndarray) -> float:
     """Find initial t0 guess using smoothed flux minimum."""
     try:
-        smoothed = pd.Series(flux).rolling(window=5, center=True, min_periods=1).median()
-        min_idx = np.nanargmin(smoothed)
-        return time[min_idx]
+        return time[np.nanargmin(rolling_median(flux))]
     except (ValueError, IndexError):
         return time[np.argmin(flux)]
 
 
-def _process_single_transit(
+def _window_slice(time: np.ndarray, start: float, end: float, closed: bool) -> slice:
+    """
+    Slice of a sorted time array within (start, end), or [start, end] if closed.
+
+    Binary search replaces a full-length mask per transit, and the slice gives
+    views rather than copies of the data.
+    """
+    lo = np.searchsorted(time, start, side="left" if closed else "right")
+    hi = np.searchsorted(time, end, side="right" if closed else "left")
+    return slice(int(lo), int(hi))
+
+
+def _fit_single_transit(
     time: np.ndarray,
     flux: np.ndarray,
     t0_expected: float,
     transit_num: int,
     params: TransitParams,
-    model_params: ModelParams,
     rp_global: float,
     a_global: float,
-    period: float,
     duration: float,
-    output_path: Path,
-    dpi: int,
     skip_fitting: bool,
-) -> TransitFitResult | None:
+) -> TransitWindow | None:
     """
-    Process a single transit and generate its plot.
+    Fit the center of a single transit and select the data to plot around it.
 
-    Returns TransitFitResult on success, None on failure.
+    Returns TransitWindow on success, None on failure.
     """
     search_window = max(duration * 2.0, 0.5)
-    search_mask = np.abs(time - t0_expected) < search_window
-    time_search = time[search_mask]
-    flux_search = flux[search_mask]
+    search = _window_slice(time, t0_expected - search_window, t0_expected + search_window, closed=False)
+    time_search = time[search]
+    flux_search = flux[search]
 
     if len(time_search) < 10:
         logger.warning(f"Transit {transit_num}: insufficient data points")
@@ -137,10 +205,6 @@ def _process_single_transit(
     t0_initial = _find_initial_t0(time_search, flux_search)
 
     t0_fitted = None
-    model_flux = None
-    ttv_minutes = None
-    rms_residuals = None
-
     if not skip_fitting:
         fitted = fit_transit_t0(time_search, flux_search, params, rp_global, a_global, t0_initial)
         if fitted is not None:
@@ -148,50 +212,93 @@ def _process_single_transit(
 
     time_center = t0_fitted if t0_fitted is not None else t0_expected
     plot_window = duration * 1.25
-    plot_mask = (time >= time_center - plot_window) & (time <= time_center + plot_window)
-    time_plot = time[plot_mask]
-    flux_plot = flux[plot_mask]
+    plot = _window_slice(time, time_center - plot_window, time_center + plot_window, closed=True)
+    time_plot = time[plot]
 
     if len(time_plot) == 0:
         logger.warning(f"Transit {transit_num}: no data in plot window")
         return None
 
-    if t0_fitted is not None:
-        model_flux = batman_model(
-            time_plot,
-            t0_fitted,
-            period,
-            rp_global,
-            a_global,
-            model_params.inc,
-            model_params.u1,
-            model_params.u2,
-            model_params.ecc,
-            model_params.w,
-            model_params.exp_time,
-            model_params.supersample,
-        )
-        residuals = flux_plot - model_flux
-        rms_residuals = float(np.sqrt(np.mean(residuals**2)))
-        ttv_minutes = (t0_fitted - t0_expected) * 24 * 60
+    return TransitWindow(time=time_plot, flux=flux[plot], t0_fitted=t0_fitted)
+
+
+def _transit_models(
+    windows: list[TransitWindow],
+    period: float,
+    rp_global: float,
+    a_global: float,
+    model_params: ModelParams,
+) -> list[np.ndarray | None]:
+    """
+    Evaluate the model flux of every fitted transit window with a single batman call.
+
+    All transits share the global parameters, so each window is shifted to its
+    own fitted center and the windows are evaluated together with t0=0. The
+    shift is exact for times this close to the center.
+
+    Returns:
+        Model flux per window, None for windows without a fitted t0.
+    """
+    fitted = [w for w in windows if w.t0_fitted is not None]
+    if not fitted:
+        return [None] * len(windows)
+
+    model_all = batman_model(
+        np.concatenate([w.time - w.t0_fitted for w in fitted]),
+        0.0,
+        period,
+        rp_global,
+        a_global,
+        model_params.inc,
+        model_params.u1,
+        model_params.u2,
+        model_params.ecc,
+        model_params.w,
+        model_params.exp_time,
+        model_params.supersample,
+    )
+    models = iter(np.split(model_all, np.cumsum([len(w.time) for w in fitted])[:-1]))
+    return [next(models) if w.t0_fitted is not None else None for w in windows]
+
+
+def _plot_single_transit(
+    window: TransitWindow,
+    model_flux: np.ndarray | None,
+    t0_expected: float,
+    transit_num: int,
+    output_path: Path,
+    dpi: int,
+    compress_level: int,
+    figure: tuple[Figure, Axes, Axes] | None = None,
+    writer: PngWriter | None = None,
+) -> TransitFitResult:
+    """Compute the fit statistics of a single transit and generate its plot."""
+    ttv_minutes = None
+    rms_residuals = None
+    if model_flux is not None:
+        rms_residuals = float(np.sqrt(sum_squared_residuals(window.flux, model_flux) / len(window.flux)))
+        ttv_minutes = (window.t0_fitted - t0_expected) * 24 * 60
 
     plot_transit(
-        time=time_plot,
-        flux=flux_plot,
+        time=window.time,
+        flux=window.flux,
         model_flux=model_flux,
-        t0_fitted=t0_fitted,
+        t0_fitted=window.t0_fitted,
         t0_expected=t0_expected,
         ttv_minutes=ttv_minutes,
         rms_residuals=rms_residuals,
         output_path=output_path,
         dpi=dpi,
         transit_index=transit_num,
+        compress_level=compress_level,
+        figure=figure,
+        writer=writer,
     )
 
     logger.debug(f"Saved {output_path.name}")
 
     return TransitFitResult(
-        t0_fitted=t0_fitted,
+        t0_fitted=window.t0_fitted,
         ttv_minutes=ttv_minutes,
         rms_residuals=rms_residuals,
     )
@@ -203,6 +310,8 @@ def process_file(
     dpi: int = 150,
     skip_fitting: bool = False,
     force: bool = False,
+    cache_dir: Path | None = None,
+    compress_level: int = 1,
 ) -> tuple[list[TransitRecord], LightCurveRecord | None]:
     """
     Process a single light curve file and generate transit plots.
@@ -213,65 +322,290 @@ def process_file(
         dpi: Plot resolution.
         skip_fitting: If True, skip model fitting and only plot data.
         force: If True, regenerate plots even if they already exist.
+        cache_dir: Optional directory to cache parsed light curves in. Keep it
+            outside output_dir, which is served as is.
+        compress_level: PNG compression level (0-9).
 
     Returns:
         Tuple of (transit_records, light_curve_record).
     """
+    records, curve_record, new_failed = _process_file(
+        filepath,
+        output_dir,
+        dpi=dpi,
+        skip_fitting=skip_fitting,
+        force=force,
+        cache_dir=cache_dir,
+        compress_level=compress_level,
+    )
+    if new_failed:
+        all_failed = _load_failed_transits(output_dir)
+        _merge_failed_transits(all_failed, filepath.name, new_failed)
+        _save_failed_transits(output_dir, all_failed)
+    return records, curve_record
+
+
+def _merge_failed_transits(failed: dict[str, list[int]], filename: str, new_failed: list[int]) -> None:
+    """Add newly failed transit indices for a file to the failed transits mapping."""
+    failed[filename] = sorted(set(failed.get(filename, [])) | set(new_failed))
+
+
+def _make_curve_record(
+    filepath: Path,
+    params: TransitParams,
+    model_params: ModelParams,
+    data_type: str,
+    time_min: float,
+    time_max: float,
+    expected_transits: int,
+    found: int,
+    rp: float,
+    a: float,
+) -> LightCurveRecord:
+    """Build the curves.csv record for a light curve."""
+    return LightCurveRecord(
+        file=filepath.name,
+        time_min=time_min,
+        time_max=time_max,
+        expected_transits=expected_transits,
+        found_transits=found,
+        data_type=data_type,
+        period=params.Periodo_orbital_d,
+        epoch=params.Epoca_BJDS,
+        duration=params.Duracion_d,
+        rp=rp,
+        a=a,
+        inc=model_params.inc,
+        u1=model_params.u1,
+        u2=model_params.u2,
+    )
+
+
+def _list_plots(output_dir: Path) -> dict[str, set[str]]:
+    """Names of the transit plots already in output_dir by input file stem, from one directory listing."""
+    try:
+        names = os.listdir(output_dir)
+    except FileNotFoundError:
+        return {}
+    plots: dict[str, set[str]] = {}
+    for name in names:
+        basename, sep, _ = name.rpartition("_transit_")
+        if sep and name.endswith(".png"):
+            plots.setdefault(basename, set()).add(name)
+    return plots
+
+
+def _expected_transit_times(
+    time_min: float, time_max: float, n_rows: int, t0_epoch: float, period: float
+) -> np.ndarray:
+    """
+    Expected transit times of a light curve, from its time range and row count only.
+
+    The mean step of the sorted times is (max - min) / (n - 1), so the data is not
+    scanned, and resumed and fully loaded files get the same transits.
+    """
+    time_step = (time_max - time_min) / (n_rows - 1) if n_rows > 1 else period / 100
+    return expected_transit_times_in_range(time_min, time_max, time_step, t0_epoch, period)
+
+
+def _transit_record(
+    filepath: Path,
+    transit_num: int,
+    t0_expected: float,
+    params: TransitParams,
+    model_params: ModelParams,
+    rp: float,
+    a: float,
+    fit: TransitFitResult | None = None,
+    plot_file: str = "",
+) -> TransitRecord:
+    """Build the transits.csv record for a transit; without a fit, the fitted fields are empty."""
+    return TransitRecord(
+        file=filepath.name,
+        transit_index=transit_num,
+        t0_expected=t0_expected,
+        t0_fitted=fit.t0_fitted if fit is not None else None,
+        ttv_minutes=fit.ttv_minutes if fit is not None else None,
+        rp_fitted=rp,
+        a_fitted=a,
+        rms_residuals=fit.rms_residuals if fit is not None else None,
+        period=params.Periodo_orbital_d,
+        duration=params.Duracion_d,
+        inc=model_params.inc,
+        u1=model_params.u1,
+        u2=model_params.u2,
+        plot_file=plot_file,
+    )
+
+
+def _resume_file(
+    filepath: Path,
+    existing: set[str],
+    header: LightCurveHeader | None = None,
+    failed: list[int] | None = None,
+) -> tuple[list[TransitRecord], LightCurveRecord] | None:
+    """
+    Return the records for a file with no plots left to generate, without loading its data.
+
+    A transit is done when its plot is in existing or it failed in a previous
+    run. Only the header and the time column are read. Returns None when any
+    plot is still missing or the shortcut cannot be applied, so the caller
+    should fall back to the full load.
+    """
+    failed_for_file = set(failed or [])
+    # Transits are numbered from 1, so a missing first one ends the shortcut early
+    if f"{filepath.stem}_transit_001.png" not in existing and 1 not in failed_for_file:
+        return None
+
+    try:
+        if header is None:
+            header = read_header(filepath)
+        time_min, time_max, n_rows = read_time_range(filepath, header)
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+    params = header.params
+    period = params.Periodo_orbital_d
+    t0_epoch = params.Epoca_BJDS
+    if period is None or t0_epoch is None:
+        return None
+
+    expected_t0s = _expected_transit_times(time_min, time_max, n_rows, t0_epoch, period)
+    if len(expected_t0s) == 0:
+        return None
+
+    skipped_failed = []
+    for i, t0 in enumerate(expected_t0s):
+        transit_num = i + 1
+        if f"{filepath.stem}_transit_{transit_num:03d}.png" in existing:
+            continue
+        if transit_num not in failed_for_file:
+            return None
+        skipped_failed.append((transit_num, t0))
+
+    model_params = ModelParams.from_transit_params(params)
+    records = [
+        _transit_record(filepath, transit_num, t0, params, model_params, model_params.rp, model_params.a)
+        for transit_num, t0 in skipped_failed
+    ]
+    curve_record = _make_curve_record(
+        filepath,
+        params,
+        model_params,
+        header.file_type,
+        time_min=time_min,
+        time_max=time_max,
+        expected_transits=len(expected_t0s),
+        found=len(records),
+        rp=model_params.rp,
+        a=model_params.a,
+    )
+    return records, curve_record
+
+
+def _process_file(
+    filepath: Path,
+    output_dir: Path,
+    dpi: int = 150,
+    skip_fitting: bool = False,
+    force: bool = False,
+    cache_dir: Path | None = None,
+    compress_level: int = 1,
+    header: LightCurveHeader | None = None,
+    failed: list[int] | None = None,
+    existing: set[str] | None = None,
+) -> tuple[list[TransitRecord], LightCurveRecord | None, list[int]]:
+    """
+    Process a single light curve file without persisting failed transits.
+
+    Safe to run in a worker process: the failed transits file is only read here,
+    and the newly failed transit indices are returned so the caller can save them.
+    A header from read_header can be given to skip parsing it again, the file's
+    previously failed transit indices to skip reading the failed file, and its
+    plots already in output_dir, from _list_plots, to skip listing the directory.
+
+    Returns:
+        Tuple of (transit_records, light_curve_record, new_failed).
+    """
     basename = filepath.stem
     logger.info(f"Processing {filepath.name}")
 
+    if failed is None:
+        failed = _load_failed_transits(output_dir).get(filepath.name, [])
+    if force:
+        existing = set()
+    elif existing is None:
+        existing = _list_plots(output_dir).get(basename, set())
+
+    if not force:
+        resumed = _resume_file(filepath, existing, header, failed)
+        if resumed is not None:
+            records, curve_record = resumed
+            if records:
+                logger.info(f"All plots exist or previously failed, skipping {filepath.name}")
+            else:
+                logger.info(
+                    f"All {curve_record.expected_transits} plots already exist, skipping {filepath.name}"
+                )
+            return records, curve_record, []
+
     try:
-        time, flux, params, data_type = load_light_curve(filepath)
+        time, flux, params, data_type = load_light_curve(filepath, cache_dir=cache_dir, header=header)
     except Exception as e:
         logger.error(f"Failed to load {filepath}: {e}")
-        return [], None
+        return [], None, []
 
-    period = params.get("Periodo_orbital_d")
-    t0_epoch = params.get("Epoca_BJDS")
-    duration = params.get("Duracion_d", 0.2)
+    # Transit windows are found by binary search, which needs sorted times
+    if np.any(time[1:] < time[:-1]):
+        order = np.argsort(time, kind="stable")
+        time, flux = time[order], flux[order]
+
+    period = params.Periodo_orbital_d
+    t0_epoch = params.Epoca_BJDS
+    duration = params.Duracion_d
 
     if period is None or t0_epoch is None:
         logger.error(f"Missing period or epoch in {filepath}")
-        return [], None
+        return [], None, []
 
-    expected_t0s = calculate_expected_transit_times(time, t0_epoch, period)
+    expected_t0s = (
+        _expected_transit_times(float(time[0]), float(time[-1]), len(time), t0_epoch, period)
+        if len(time) > 0
+        else np.array([])
+    )
     if len(expected_t0s) == 0:
         logger.warning(f"No transits found in data range for {filepath}")
-        return [], None
+        return [], None, []
 
     logger.info(f"Found {len(expected_t0s)} expected transits")
 
     model_params = ModelParams.from_transit_params(params)
 
     def make_curve_record(found: int, rp: float, a: float) -> LightCurveRecord:
-        return LightCurveRecord(
-            file=filepath.name,
-            time_min=float(time.min()),
-            time_max=float(time.max()),
+        return _make_curve_record(
+            filepath,
+            params,
+            model_params,
+            data_type,
+            time_min=float(time[0]),
+            time_max=float(time[-1]),
             expected_transits=len(expected_t0s),
-            found_transits=found,
-            data_type=data_type,
-            period=period,
-            epoch=t0_epoch,
-            duration=duration,
+            found=found,
             rp=rp,
             a=a,
-            inc=model_params.inc,
-            u1=model_params.u1,
-            u2=model_params.u2,
         )
 
-    all_failed = _load_failed_transits(output_dir)
-    failed_for_file = set(all_failed.get(filepath.name, []))
+    failed_for_file = set(failed)
 
     transits_to_process = []
     skipped_failed = []
     for i, t0 in enumerate(expected_t0s):
         transit_num = i + 1
-        plot_path = output_dir / f"{basename}_transit_{transit_num:03d}.png"
+        plot_name = f"{basename}_transit_{transit_num:03d}.png"
+        plot_path = output_dir / plot_name
 
         if not force:
-            if plot_path.exists():
+            if plot_name in existing:
                 continue
             if transit_num in failed_for_file:
                 logger.debug(f"Transit {transit_num}: previously failed, skipping")
@@ -282,7 +616,7 @@ def process_file(
 
     if not transits_to_process and not skipped_failed:
         logger.info(f"All {len(expected_t0s)} plots already exist, skipping {filepath.name}")
-        return [], make_curve_record(0, model_params.rp, model_params.a)
+        return [], make_curve_record(0, model_params.rp, model_params.a), []
 
     if transits_to_process:
         logger.info(f"{len(transits_to_process)} of {len(expected_t0s)} plots need to be generated")
@@ -300,90 +634,85 @@ def process_file(
 
     for transit_num, t0_expected in skipped_failed:
         records.append(
-            TransitRecord(
-                file=filepath.name,
-                transit_index=transit_num,
-                t0_expected=t0_expected,
-                t0_fitted=None,
-                ttv_minutes=None,
-                rp_fitted=rp_global,
-                a_fitted=a_global,
-                rms_residuals=None,
-                period=period,
-                duration=duration,
-                inc=model_params.inc,
-                u1=model_params.u1,
-                u2=model_params.u2,
-            )
+            _transit_record(filepath, transit_num, t0_expected, params, model_params, rp_global, a_global)
         )
 
+    # Fit every transit first, so that all models are evaluated in one batman call
+    windows = []
     for transit_num, t0_expected, plot_path in transits_to_process:
         logger.debug(f"Processing transit {transit_num}/{len(expected_t0s)}")
-
-        fit_result = _process_single_transit(
-            time=time,
-            flux=flux,
-            t0_expected=t0_expected,
-            transit_num=transit_num,
-            params=params,
-            model_params=model_params,
-            rp_global=rp_global,
-            a_global=a_global,
-            period=period,
-            duration=duration,
-            output_path=plot_path,
-            dpi=dpi,
-            skip_fitting=skip_fitting,
+        windows.append(
+            _fit_single_transit(
+                time=time,
+                flux=flux,
+                t0_expected=t0_expected,
+                transit_num=transit_num,
+                params=params,
+                rp_global=rp_global,
+                a_global=a_global,
+                duration=duration,
+                skip_fitting=skip_fitting,
+            )
         )
+    models = iter(
+        _transit_models([w for w in windows if w is not None], period, rp_global, a_global, model_params)
+    )
 
-        if fit_result is None:
-            new_failed.append(transit_num)
-            records.append(
-                TransitRecord(
-                    file=filepath.name,
-                    transit_index=transit_num,
+    with transit_figure() as figure, PngWriter() as writer:
+        for (transit_num, t0_expected, plot_path), window in zip(transits_to_process, windows):
+            fit_result = None
+            if window is not None:
+                fit_result = _plot_single_transit(
+                    window,
+                    next(models),
                     t0_expected=t0_expected,
-                    t0_fitted=None,
-                    ttv_minutes=None,
-                    rp_fitted=rp_global,
-                    a_fitted=a_global,
-                    rms_residuals=None,
-                    period=period,
-                    duration=duration,
-                    inc=model_params.inc,
-                    u1=model_params.u1,
-                    u2=model_params.u2,
+                    transit_num=transit_num,
+                    output_path=plot_path,
+                    dpi=dpi,
+                    compress_level=compress_level,
+                    figure=figure,
+                    writer=writer,
                 )
-            )
-            continue
 
-        records.append(
-            TransitRecord(
-                file=filepath.name,
-                transit_index=transit_num,
-                t0_expected=t0_expected,
-                t0_fitted=fit_result.t0_fitted,
-                ttv_minutes=fit_result.ttv_minutes,
-                rp_fitted=rp_global,
-                a_fitted=a_global,
-                rms_residuals=fit_result.rms_residuals,
-                period=period,
-                duration=duration,
-                inc=model_params.inc,
-                u1=model_params.u1,
-                u2=model_params.u2,
-                plot_file=plot_path.name,
+            if fit_result is None:
+                new_failed.append(transit_num)
+            records.append(
+                _transit_record(
+                    filepath,
+                    transit_num,
+                    t0_expected,
+                    params,
+                    model_params,
+                    rp_global,
+                    a_global,
+                    fit=fit_result,
+                    plot_file=plot_path.name if fit_result is not None else "",
+                )
             )
-        )
 
     if new_failed:
-        all_failed[filepath.name] = sorted(set(failed_for_file) | set(new_failed))
-        _save_failed_transits(output_dir, all_failed)
         logger.info(f"Marked {len(new_failed)} transits as failed for {filepath.name}")
 
     logger.info(f"Generated {len(records)} plots for {filepath.name}")
 
-    return records, make_curve_record(len(records), rp_global, a_global)
+    return records, make_curve_record(len(records), rp_global, a_global), new_failed
+
+
+def find_csv_files(data_dir: Path, files: list[str] | None = None) -> list[Path]:
+    """
+    List the CSV files to process without reading them.
+
+    Args:
+        data_dir: Directory containing input CSV files.
+        files: Optional list of specific filenames; missing ones are ignored.
+
+    Returns:
+        Paths of the CSV files, sorted by name when no files are given.
+    """
+    data_dir = Path(data_dir)
+    if files:
+        return [f for f in (data_dir / name for name in files) if f.exists()]
+    return sorted(data_dir.glob("*.csv"))
 
 
 def generate_all(
@@ -394,6 +723,9 @@ def generate_all(
     skip_fitting: bool = False,
     dry_run: bool = False,
     force: bool = False,
+    cache_dir: Path | None = None,
+    compress_level: int = 1,
+    workers: int | None = None,
 ) -> list[TransitRecord]:
     """
     Generate transit plots for all CSV files in a directory.
@@ -404,20 +736,21 @@ def generate_all(
         files: Optional list of specific filenames to process.
         dpi: Plot resolution.
         skip_fitting: If True, skip model fitting.
-        dry_run: If True, only list files without processing.
+        dry_run: If True, only print the file names without processing.
         force: If True, regenerate plots even if they already exist.
+        cache_dir: Optional directory to cache parsed light curves and headers in.
+            Keep it outside output_dir, which is served as is.
+        compress_level: PNG compression level (0-9).
+        workers: Number of worker processes. Defaults to the CPU count.
 
     Returns:
         List of all TransitRecord objects.
     """
     data_dir = Path(data_dir)
     output_dir = Path(output_dir)
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
 
-    if files:
-        csv_files = [f for f in (data_dir / name for name in files) if f.exists()]
-    else:
-        csv_files = sorted(data_dir.glob("*.csv"))
-
+    csv_files = find_csv_files(data_dir, files)
     if not csv_files:
         logger.warning(f"No CSV files found in {data_dir}")
         return []
@@ -430,29 +763,70 @@ def generate_all(
         return []
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    transits_csv = output_dir / SUMMARY_CSV_FILE
+    curves_csv = output_dir / CURVES_CSV_FILE
 
     all_transit_records = []
-    all_curve_records = []
-
-    for filepath in csv_files:
-        try:
-            transit_records, curve_record = process_file(
-                filepath, output_dir, dpi=dpi, skip_fitting=skip_fitting, force=force
+    curves_written = False
+    all_failed = _load_failed_transits(output_dir)
+    failed_changed = False
+
+    headers = _prescan(csv_files, cache_dir=cache_dir)
+    plots = {} if force else _list_plots(output_dir)
+
+    # Each file is an independent CPU-bound unit (parsing, fitting, rendering),
+    # so files are dispatched to worker processes and results merged here.
+    max_workers = min(workers or os.cpu_count() or 1, len(csv_files))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_init_worker,
+        initargs=(logger.getEffectiveLevel(),),
+    ) as executor:
+        futures = [
+            (
+                filepath,
+                executor.submit(
+                    _process_file,
+                    filepath,
+                    output_dir,
+                    dpi=dpi,
+                    skip_fitting=skip_fitting,
+                    force=force,
+                    cache_dir=cache_dir,
+                    compress_level=compress_level,
+                    header=header,
+                    failed=all_failed.get(filepath.name, []),
+                    existing=plots.get(filepath.stem, set()),
+                ),
             )
+            for filepath, header in zip(csv_files, headers)
+        ]
+        for filepath, future in futures:
+            try:
+                transit_records, curve_record, new_failed = future.result()
+            except Exception as e:
+                logger.error(f"Error processing {filepath}: {e}")
+                continue
+            # Rows are appended as each file completes and deduplicated once at the end
             all_transit_records.extend(transit_records)
+            save_summary_csv(transit_records, transits_csv, mode="append")
             if curve_record is not None:
-                all_curve_records.append(curve_record)
-        except Exception as e:
-            logger.error(f"Error processing {filepath}: {e}")
+                save_light_curves_csv([curve_record], curves_csv, mode="append")
+                curves_written = True
+            if new_failed:
+                _merge_failed_transits(all_failed, filepath.name, new_failed)
+                failed_changed = True
+
+    if failed_changed:
+        _save_failed_transits(output_dir, all_failed)
 
     if all_transit_records:
-        csv_path = output_dir / "transits.csv"
-        save_summary_csv(all_transit_records, csv_path)
-        logger.info(f"Saved transit summary to {csv_path}")
-
-    if all_curve_records:
-        csv_path = output_dir / "curves.csv"
-        save_light_curves_csv(all_curve_records, csv_path)
-        logger.info(f"Saved light curves to {csv_path}")
+        finalize_summary_csv(transits_csv)
+        logger.info(f"Saved transit summary to {transits_csv}")
+
+    if curves_written:
+        finalize_light_curves_csv(curves_csv)
+        logger.info(f"Saved light curves to {curves_csv}")
 
     return all_transit_records
@@ -1,9 +1,113 @@
 """Transit light curve plotting utilities."""
 
+import io
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Self
 
+import matplotlib.image
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+_TIGHT_PAD = 0.1 * 72 / 10  # 0.1 inch at the default 10 pt font size
+
+
+def create_transit_figure() -> tuple[Figure, Axes, Axes]:
+    """Create the figure layout used for transit plots: main panel above residuals."""
+    fig, (ax_main, ax_res) = plt.subplots(
+        2, 1, figsize=(10, 8), sharex=True, gridspec_kw={"height_ratios": [3, 1]}
+    )
+    return fig, ax_main, ax_res
+
+
+@contextmanager
+def transit_figure() -> Iterator[tuple[Figure, Axes, Axes]]:
+    """Provide a transit figure that can be reused across plot_transit calls and is closed on exit."""
+    figure = create_transit_figure()
+    try:
+        yield figure
+    finally:
+        plt.close(figure[0])
+
+
+class PngWriter:
+    """
+    Encode and write rendered plots as PNG files in background threads.
+
+    PNG compression runs outside the GIL, so it overlaps with fitting and drawing
+    the next transit. At most max_pending images are held in memory; close() (or
+    leaving the with block) waits for all writes and re-raises the first error.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: deque[Future] = deque()
+        self._max_pending = max_pending
+
+    def submit(self, output_path: Path, rgba: np.ndarray, dpi: int, compress_level: int) -> None:
+        """Queue an RGBA image for writing, waiting first if too many are pending."""
+        while len(self._pending) >= self._max_pending:
+            self._pending.popleft().result()
+        self._pending.append(self._executor.submit(_write_png, output_path, rgba, dpi, compress_level))
+
+    def close(self) -> None:
+        """Wait for all queued images to be written."""
+        try:
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _render_rgba(fig: Figure, dpi: int) -> np.ndarray:
+    """Render a figure as savefig would, without encoding it.
+
+    Raises:
+        ValueError: If the rendered buffer does not match the figure size at dpi.
+    """
+    sink = io.BytesIO()
+    fig.savefig(sink, format="rgba", dpi=dpi)
+    width, height = np.round(fig.get_size_inches() * dpi).astype(int)
+    buffer = np.frombuffer(sink.getbuffer(), dtype=np.uint8)
+    if buffer.size != width * height * 4:
+        raise ValueError(f"Rendered {buffer.size} bytes, expected a {width}x{height} RGBA image")
+    return buffer.reshape(height, width, 4)
+
+
+def _write_png(output_path: Path, rgba: np.ndarray, dpi: int, compress_level: int) -> None:
+    """
+    Encode an RGBA image to PNG exactly as savefig does.
+
+    The parent directory is only created if the first write finds it missing,
+    which saves a mkdir call per plot when writing many plots to one directory.
+    """
+    try:
+        _imsave_png(output_path, rgba, dpi, compress_level)
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _imsave_png(output_path, rgba, dpi, compress_level)
+
+
+def _imsave_png(output_path: Path, rgba: np.ndarray, dpi: int, compress_level: int) -> None:
+    matplotlib.image.imsave(
+        output_path,
+        rgba,
+        format="png",
+        origin="upper",
+        dpi=dpi,
+        pil_kwargs={"optimize": False, "compress_level": compress_level},
+    )
 
 
 def plot_transit(
@@ -17,6 +121,9 @@ def plot_transit(
     output_path: Path,
     dpi: int = 150,
     transit_index: int | None = None,
+    compress_level: int = 1,
+    figure: tuple[Figure, Axes, Axes] | None = None,
+    writer: PngWriter | None = None,
 ) -> None:
     """
     Generate a transit light curve plot with residuals.
@@ -32,10 +139,20 @@ def plot_transit(
         output_path: Path to save the PNG file.
         dpi: Plot resolution.
         transit_index: Transit number for the title (1-indexed).
+        compress_level: zlib compression level (0-9) for the PNG file. Low levels
+            encode much faster at the cost of somewhat larger files.
+        figure: Optional (fig, ax_main, ax_res) from create_transit_figure to draw
+            into. The axes are cleared first and the figure is left open so it can
+            be reused for the next plot; the caller must close it.
+        writer: Optional PngWriter to encode and write the PNG file in the
+            background. The file is complete only once the writer is closed.
     """
-    fig, (ax_main, ax_res) = plt.subplots(
-        2, 1, figsize=(10, 8), sharex=True, gridspec_kw={"height_ratios": [3, 1]}
-    )
+    if figure is None:
+        fig, ax_main, ax_res = create_transit_figure()
+    else:
+        fig, ax_main, ax_res = figure
+        ax_main.clear()
+        ax_res.clear()
 
     # Main transit plot
     if len(time) > 0:
@@ -84,9 +201,15 @@ def plot_transit(
     ax_res.set_xlabel("Time [BJDS]")
     ax_res.grid(True)
 
-    plt.tight_layout()
+    # The layout already leaves a 0.1 inch margin around all artists (pad is in
+    # font sizes), so saving needs no separate bbox_inches="tight" pass
+    fig.tight_layout(pad=_TIGHT_PAD)
 
     # Save and close
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
+    rgba = _render_rgba(fig, dpi)
+    if writer is not None:
+        writer.submit(output_path, rgba, dpi, compress_level)
+    else:
+        _write_png(output_path, rgba, dpi, compress_level)
+    if figure is None:
+        plt.close(fig)
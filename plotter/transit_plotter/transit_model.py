@@ -1,24 +1,25 @@
 """Transit model fitting using Batman package."""
 
 import warnings
-from typing import Any
+from collections.abc import Callable
+from functools import lru_cache
 
 import batman as bm
 import numpy as np
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.optimize import curve_fit, minimize
 
-from transit_plotter.types import (
-    DEFAULT_ECC,
-    DEFAULT_EXP_TIME,
-    DEFAULT_INC,
-    DEFAULT_SUPERSAMPLE,
-    DEFAULT_U1,
-    DEFAULT_U2,
-    DEFAULT_W,
-    FittedTransit,
-    TransitParams,
-)
+from transit_plotter.types import FittedTransit, TransitParams
+
+# Step in days for the derivative of a model with respect to t0
+T0_JAC_STEP = 1e-5
+
+# Parameter step and relative chi2 tolerance of the global Levenberg-Marquardt fit
+LM_JAC_STEP = 1e-5
+LM_RTOL = 1e-9
+
+# Number of light curves kept per reusable window model
+LIGHT_CURVE_CACHE_SIZE = 8
 
 
 def batman_model(
@@ -69,9 +70,54 @@ def batman_model(
     return model.light_curve(params)
 
 
-def calculate_expected_transit_times(
-    time_data: np.ndarray, t0: float, period: float
-) -> np.ndarray:
+def _batman_window_model(
+    time: np.ndarray,
+    t0: float,
+    period: float,
+    rp: float,
+    a: float,
+    inc: float,
+    u1: float,
+    u2: float,
+    ecc: float,
+    w: float,
+    exp_time: float,
+    supersample_factor: int,
+) -> Callable[[float, float, float], np.ndarray]:
+    """
+    Build a reusable Batman model of a fixed time array, evaluated as light_curve(t0, rp, a).
+
+    The TransitModel (supersampled time grid, input checks) is set up once from
+    the initial values; batman recomputes the orbit only when t0 or a change.
+    The results are the same as from batman_model. The latest curves are kept,
+    read-only, since fits evaluate the same parameters again, e.g. the fitted t0.
+    """
+    params = bm.TransitParams()
+    params.t0 = t0
+    params.per = period
+    params.rp = rp
+    params.a = a
+    params.inc = inc
+    params.ecc = ecc
+    params.w = w
+    params.limb_dark = "quadratic"
+    params.u = [u1, u2]
+
+    model = bm.TransitModel(params, time, exp_time=exp_time, supersample_factor=int(supersample_factor))
+
+    @lru_cache(maxsize=LIGHT_CURVE_CACHE_SIZE)
+    def light_curve(t0: float, rp: float, a: float) -> np.ndarray:
+        params.t0 = t0
+        params.rp = rp
+        params.a = a
+        model_flux = model.light_curve(params)
+        model_flux.flags.writeable = False
+        return model_flux
+
+    return light_curve
+
+
+def calculate_expected_transit_times(time_data: np.ndarray, t0: float, period: float) -> np.ndarray:
     """
     Calculate expected transit times within the data time range.
 
@@ -87,6 +133,29 @@ def calculate_expected_transit_times(
         return np.array([])
 
     min_time, max_time = np.min(time_data), np.max(time_data)
+    # The mean of the successive differences telescopes to (last - first) / (n - 1)
+    time_step = (time_data[-1] - time_data[0]) / (len(time_data) - 1) if len(time_data) > 1 else period / 100
+    return expected_transit_times_in_range(min_time, max_time, time_step, t0, period)
+
+
+def expected_transit_times_in_range(
+    min_time: float, max_time: float, time_step: float, t0: float, period: float
+) -> np.ndarray:
+    """
+    Calculate expected transit times between min_time and max_time.
+
+    Transits up to two time steps outside the range are included.
+
+    Args:
+        min_time: First observation time.
+        max_time: Last observation time.
+        time_step: Mean sampling interval of the observations.
+        t0: Reference transit epoch.
+        period: Orbital period in days.
+
+    Returns:
+        Array of expected transit times.
+    """
     start_epoch = (min_time - t0) / period
     end_epoch = (max_time - t0) / period
 
@@ -95,16 +164,110 @@ def calculate_expected_transit_times(
     epochs = np.arange(n_start, n_end + 1)
 
     all_expected = t0 + epochs * period
-    time_step = np.mean(np.diff(time_data)) if len(time_data) > 1 else period / 100
     margin = time_step * 2
 
-    filtered = all_expected[(all_expected >= min_time - margin) & (all_expected <= max_time + margin)]
-    return np.sort(filtered)
+    # Epochs are increasing, so the selected times are already in order
+    return all_expected[(all_expected >= min_time - margin) & (all_expected <= max_time + margin)]
+
 
+def sum_squared_residuals(flux: np.ndarray, model_flux: np.ndarray) -> float:
+    """Sum of squared residuals between observed and model flux, as a single dot product."""
+    residuals = np.subtract(flux, model_flux, dtype=np.float64)
+    return float(np.dot(residuals, residuals))
 
-def _get_param(params: TransitParams, key: str, default: Any) -> Any:
-    """Get parameter value with default fallback."""
-    return params.get(key, default)
+
+def rolling_median(values: np.ndarray, window: int = 5) -> np.ndarray:
+    """
+    Centered rolling median that ignores NaN and shrinks the window at the edges.
+
+    Matches pandas' rolling(window, center=True, min_periods=1).median() without
+    building a Series: the windows are sorted as one strided view, with NaN
+    sorting last, and the median is read from the valid part of each row.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    before = window // 2
+    padded = np.concatenate([np.full(before, np.nan), values, np.full(window - 1 - before, np.nan)])
+    windows = np.sort(sliding_window_view(padded, window), axis=1)
+
+    counts = np.count_nonzero(~np.isnan(windows), axis=1)
+    rows = np.arange(len(windows))
+    median = (windows[rows, (counts - 1) // 2] + windows[rows, counts // 2]) / 2
+    median[counts == 0] = np.nan
+    return median
+
+
+def _period(params: TransitParams) -> float:
+    """Orbital period, falling back to a nominal value when the header lacks one."""
+    return params.Periodo_orbital_d if params.Periodo_orbital_d is not None else 2.36
+
+
+def _levenberg_marquardt(
+    residuals: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    max_iter: int = 20,
+) -> np.ndarray:
+    """
+    Minimize a sum of squared residuals within bounds by Levenberg-Marquardt.
+
+    The Gauss-Newton approximation J^T J of the Hessian, with J from central
+    differences, takes few iterations on the smooth, few-parameter chi2 of a
+    transit fit, with 2 * len(x0) + 1 residual evaluations each.
+
+    Args:
+        residuals: Residual vector as a function of the parameters.
+        x0: Initial parameters.
+        lower, upper: Parameter bounds.
+        max_iter: Maximum number of iterations.
+
+    Returns:
+        Parameters with the lowest sum of squared residuals found.
+
+    Raises:
+        ValueError: If the residuals at the initial parameters are not finite.
+    """
+    x = np.clip(np.asarray(x0, dtype=np.float64), lower, upper)
+    r = residuals(x)
+    chi2 = r @ r
+    if not np.isfinite(chi2):
+        raise ValueError("Non-finite residuals at the initial parameters")
+    damping = 1e-3
+
+    for _ in range(max_iter):
+        jacobian = np.empty((len(r), len(x)))
+        for j in range(len(x)):
+            x_up = x.copy()
+            x_up[j] += LM_JAC_STEP
+            x_down = x.copy()
+            x_down[j] -= LM_JAC_STEP
+            jacobian[:, j] = (residuals(x_up) - residuals(x_down)) / (2 * LM_JAC_STEP)
+        hessian = jacobian.T @ jacobian
+        gradient = jacobian.T @ r
+
+        # Raise the damping until a step lowers chi2; if none does, x is a minimum
+        while True:
+            try:
+                step = np.linalg.solve(hessian + damping * np.diag(np.diag(hessian)), -gradient)
+            except np.linalg.LinAlgError:
+                # The residuals do not depend on some parameter, e.g. flat flux
+                return x
+            x_new = np.clip(x + step, lower, upper)
+            r_new = residuals(x_new)
+            chi2_new = r_new @ r_new
+            if chi2_new < chi2:
+                break
+            damping *= 10.0
+            if damping > 1e10:
+                return x
+
+        converged = chi2 - chi2_new <= LM_RTOL * chi2
+        x, r, chi2 = x_new, r_new, chi2_new
+        damping = max(damping / 10.0, 1e-7)
+        if converged:
+            break
+
+    return x
 
 
 def fit_global_parameters(
@@ -117,95 +280,147 @@ def fit_global_parameters(
     Fit global planet radius and semi-major axis across all transits.
 
     Args:
-        time: Full time array.
+        time: Full time array, sorted.
         flux: Full flux array.
-        params: Transit parameters dictionary.
+        params: Transit parameters.
         expected_t0s: Array of expected transit center times.
 
     Returns:
         Tuple of (fitted_rp, fitted_a).
     """
-    rp_initial = _get_param(params, "Radio_Planeta_R_star", 0.1)
-    a_initial = _get_param(params, "Semieje_a_R_star", 8.0)
+    rp_initial = params.Radio_Planeta_R_star
+    a_initial = params.Semieje_a_R_star
 
     # Set bounds
     rp_lower = max(rp_initial * 0.85, 1e-4)
     rp_upper = min(rp_initial * 1.15, 1.0)
     a_lower = max(a_initial * 0.85, 1.0)
     a_upper = a_initial * 1.15
-    bounds = [(rp_lower, rp_upper), (a_lower, a_upper)]
 
     # Fixed parameters for optimization
-    period = _get_param(params, "Periodo_orbital_d", 2.36)
-    inc = _get_param(params, "Inc_planeta_deg", DEFAULT_INC)
-    u1 = _get_param(params, "Coeficiente_LD_u1", DEFAULT_U1)
-    u2 = _get_param(params, "Coeficiente_LD_u2", DEFAULT_U2)
-    ecc = _get_param(params, "ecc", DEFAULT_ECC)
-    w = _get_param(params, "w_deg", DEFAULT_W)
-    exp_time = _get_param(params, "exp_time", DEFAULT_EXP_TIME)
-    supersample = int(_get_param(params, "supersample_factor", DEFAULT_SUPERSAMPLE))
-    duration = _get_param(params, "Duracion_d", 0.2)
-
-    def chi2_optimizer(opt_params: np.ndarray) -> float:
-        rp_opt, a_opt = opt_params
-        total_chi2 = 0.0
-
-        for t_cent in expected_t0s:
-            search_window = max(duration * 1.5, 0.5)
-            idx = np.where(np.abs(time - t_cent) < search_window)[0]
-
-            if len(idx) <= 5:
-                continue
-
-            transit_time = time[idx]
-            transit_flux = flux[idx]
-
-            # Find initial t0 guess using smoothed minimum
-            try:
-                smoothed = pd.Series(transit_flux).rolling(window=5, center=True, min_periods=1).median()
-                t0_guess = transit_time[np.nanargmin(smoothed)]
-            except (ValueError, IndexError):
-                t0_guess = transit_time[np.argmin(transit_flux)]
-
-            # Inner optimization for t0
-            def chi2_t0(t0_arr: np.ndarray) -> float:
-                model_flux = batman_model(
-                    transit_time, t0_arr[0], period, rp_opt, a_opt, inc, u1, u2, ecc, w, exp_time, supersample
-                )
-                return float(np.sum((transit_flux - model_flux) ** 2))
-
-            t0_margin = duration / 2.0 + 0.1
-            t0_bounds = [(t_cent - t0_margin, t_cent + t0_margin)]
+    period = _period(params)
+    inc = params.Inc_planeta_deg
+    u1 = params.Coeficiente_LD_u1
+    u2 = params.Coeficiente_LD_u2
+    ecc = params.ecc
+    w = params.w_deg
+    exp_time = params.exp_time
+    supersample = int(params.supersample_factor)
+    duration = params.Duracion_d
+
+    # The transit windows do not depend on rp and a, so they are selected once,
+    # by binary search on the sorted times. Times are kept relative to each
+    # expected center (exact for times this close), so that all windows can
+    # be evaluated in one batman call.
+    search_window = max(duration * 1.5, 0.5)
+    t0_margin = duration / 2.0 + 0.1
+    window_lo = np.searchsorted(time, expected_t0s - search_window, side="right")
+    window_hi = np.searchsorted(time, expected_t0s + search_window, side="left")
+    window_times = []
+    window_fluxes = []
+    offsets_initial = []
+    for t_cent, lo, hi in zip(expected_t0s, window_lo, window_hi):
+        transit_time = time[lo:hi]
+        transit_flux = flux[lo:hi]
+
+        # A single non-finite sample would spoil the chi2 of every window, since
+        # they are fitted together, so such samples are left out up front
+        finite = np.isfinite(transit_flux)
+        if not finite.all():
+            transit_time = transit_time[finite]
+            transit_flux = transit_flux[finite]
+
+        if len(transit_time) <= 5:
+            continue
 
-            try:
-                result = minimize(chi2_t0, [t0_guess], method="L-BFGS-B", bounds=t0_bounds)
-                if result.success:
-                    t0_opt = result.x[0]
-                    model_flux = batman_model(
-                        transit_time, t0_opt, period, rp_opt, a_opt, inc, u1, u2, ecc, w, exp_time, supersample
-                    )
-                    total_chi2 += np.sum((transit_flux - model_flux) ** 2)
-                else:
-                    total_chi2 += 1e20
-            except Exception:
-                total_chi2 += 1e20
-
-        return total_chi2
+        # Find initial t0 guess using smoothed minimum
+        t0_guess = transit_time[np.argmin(rolling_median(transit_flux))]
+
+        window_times.append(transit_time - t_cent)
+        window_fluxes.append(transit_flux)
+        offsets_initial.append(np.clip(t0_guess - t_cent, -t0_margin, t0_margin))
+
+    if not window_times:
+        return rp_initial, a_initial
+
+    n_windows = len(window_times)
+    time_rel = np.concatenate(window_times)
+    flux_all = np.concatenate(window_fluxes).astype(np.float64)
+    window_ids = np.repeat(np.arange(n_windows), [len(t) for t in window_times])
+    window_starts = np.cumsum([0] + [len(t) for t in window_times[:-1]])
+    offset_bounds = [(-t0_margin, t0_margin)] * n_windows
+
+    # The chi2 of every window comes from one Batman call over all of them. The
+    # shifted times change with the offsets, so the model is set up each time,
+    # which costs less than a light_curve call per window once there are a few.
+    def window_chi2(offsets: np.ndarray, rp_opt: float, a_opt: float) -> np.ndarray:
+        model_flux = batman_model(
+            time_rel - offsets[window_ids],
+            0.0,
+            period,
+            rp_opt,
+            a_opt,
+            inc,
+            u1,
+            u2,
+            ecc,
+            w,
+            exp_time,
+            supersample,
+        )
+        residuals = flux_all - model_flux
+        return np.add.reduceat(residuals * residuals, window_starts)
+
+    # The t0 of every window is solved jointly for a given rp and a. The windows
+    # are independent, so the chi2 of each one only depends on its own offset:
+    # shifting all offsets at once gives every partial derivative, as a central
+    # difference over a step well above the rounding noise of the supersampled
+    # model. L-BFGS-B often stops at its iteration limit or on a line search
+    # failure where chi2 is flat, so its last point is kept unless it is worse
+    # than the start.
+    def solve_offsets(offsets_start: np.ndarray, rp_opt: float, a_opt: float) -> np.ndarray:
+        def chi2_t0(offsets: np.ndarray) -> tuple[float, np.ndarray]:
+            chi2 = window_chi2(offsets, rp_opt, a_opt)
+            chi2_up = window_chi2(offsets + T0_JAC_STEP, rp_opt, a_opt)
+            chi2_down = window_chi2(offsets - T0_JAC_STEP, rp_opt, a_opt)
+            return float(chi2.sum()), (chi2_up - chi2_down) / (2 * T0_JAC_STEP)
+
+        offsets_start = np.asarray(offsets_start)
+        result = minimize(chi2_t0, offsets_start, jac=True, method="L-BFGS-B", bounds=offset_bounds)
+        chi2_start = window_chi2(offsets_start, rp_opt, a_opt).sum()
+        return result.x if np.isfinite(result.fun) and result.fun <= chi2_start else offsets_start
+
+    # rp and a are fitted with the offsets held fixed, in one Batman call per
+    # evaluation over all windows
+    def fit_rp_a(offsets: np.ndarray, x0: np.ndarray) -> np.ndarray:
+        shifted_time = time_rel - offsets[window_ids]
+        light_curve = _batman_window_model(
+            shifted_time, 0.0, period, x0[0], x0[1], inc, u1, u2, ecc, w, exp_time, supersample
+        )
+        return _levenberg_marquardt(
+            lambda x: flux_all - light_curve(0.0, x[0], x[1]),
+            x0,
+            np.array([rp_lower, a_lower]),
+            np.array([rp_upper, a_upper]),
+        )
 
+    # The inputs are validated above; only a model that is not finite at the
+    # starting parameters, e.g. from a bad header value, makes the fit give up
+    x = np.array([rp_initial, a_initial])
+    offsets = solve_offsets(np.asarray(offsets_initial), rp_initial, a_initial)
     try:
-        result = minimize(
-            chi2_optimizer,
-            [rp_initial, a_initial],
-            method="L-BFGS-B",
-            bounds=bounds,
-            options={"maxiter": 1000},
-        )
-        if result.success:
-            return float(result.x[0]), float(result.x[1])
-    except Exception as e:
+        x = fit_rp_a(offsets, x)
+
+        # The transit is symmetric about t0 while rp and a change it evenly, so
+        # the offsets couple only weakly with them: one re-solve at the fitted
+        # rp and a, and a last fit from there, settle both
+        offsets = solve_offsets(offsets, x[0], x[1])
+        x = fit_rp_a(offsets, x)
+    except ValueError as e:
         warnings.warn(f"Global fit failed: {e}")
+        return rp_initial, a_initial
 
-    return rp_initial, a_initial
+    return float(x[0]), float(x[1])
 
 
 def fit_transit_t0(
@@ -222,7 +437,7 @@ def fit_transit_t0(
     Args:
         time: Time array for the transit window.
         flux: Flux array for the transit window.
-        params: Transit parameters dictionary.
+        params: Transit parameters.
         rp: Planet radius ratio (from global fit).
         a: Semi-major axis ratio (from global fit).
         t0_initial: Initial guess for transit center.
@@ -230,16 +445,16 @@ def fit_transit_t0(
     Returns:
         FittedTransit object or None if fitting fails.
     """
-    period = _get_param(params, "Periodo_orbital_d", 2.36)
-    inc = _get_param(params, "Inc_planeta_deg", DEFAULT_INC)
-    u1 = _get_param(params, "Coeficiente_LD_u1", DEFAULT_U1)
-    u2 = _get_param(params, "Coeficiente_LD_u2", DEFAULT_U2)
-    ecc = _get_param(params, "ecc", DEFAULT_ECC)
-    w = _get_param(params, "w_deg", DEFAULT_W)
-    exp_time = _get_param(params, "exp_time", DEFAULT_EXP_TIME)
-    supersample = int(_get_param(params, "supersample_factor", DEFAULT_SUPERSAMPLE))
-    duration = _get_param(params, "Duracion_d", 0.2)
-    max_ttv = _get_param(params, "Amplitud_TTV_d", 2.0)
+    period = _period(params)
+    inc = params.Inc_planeta_deg
+    u1 = params.Coeficiente_LD_u1
+    u2 = params.Coeficiente_LD_u2
+    ecc = params.ecc
+    w = params.w_deg
+    exp_time = params.exp_time
+    supersample = int(params.supersample_factor)
+    duration = params.Duracion_d
+    max_ttv = params.Amplitud_TTV_d
 
     # Check for constant flux
     if np.all(flux == flux[0]):
@@ -262,8 +477,21 @@ def fit_transit_t0(
     best_t0 = None
     min_chi2 = np.inf
 
+    # curve_fit always evaluates the model on the same time array
+    light_curve = _batman_window_model(
+        time, t0_initial, period, rp, a, inc, u1, u2, ecc, w, exp_time, supersample
+    )
+
     def model_func(t: np.ndarray, t0: float) -> np.ndarray:
-        return batman_model(t, t0, period, rp, a, inc, u1, u2, ecc, w, exp_time, supersample)
+        return light_curve(t0, rp, a)
+
+    # The default finite-difference step is relative to t0, which at BJD scale
+    # is a sizeable fraction of the transit. The derivative is taken over a
+    # fixed step of about a second instead, from the model that curve_fit has
+    # just evaluated at the same t0.
+    def model_jac(t: np.ndarray, t0: float) -> np.ndarray:
+        derivative = (light_curve(t0 + T0_JAC_STEP, rp, a) - light_curve(t0, rp, a)) / T0_JAC_STEP
+        return derivative[:, np.newaxis]
 
     for start_t0 in valid_starts:
         local_lower = max(lower_bound, start_t0 - t0_search_margin / 2.0)
@@ -273,22 +501,28 @@ def fit_transit_t0(
             continue
 
         try:
-            popt, _ = curve_fit(
-                model_func,
-                time,
-                flux,
-                p0=[start_t0],
-                bounds=([local_lower], [local_upper]),
-                maxfev=10000,
-                method="trf",
-                ftol=1e-10,
-                xtol=1e-10,
-                gtol=1e-10,
-            )
+            # The bounds are rarely active, so the unbounded MINPACK solver is
+            # tried first; trust-region-reflective only runs if it leaves them
+            fit_options = {
+                "p0": [start_t0],
+                "jac": model_jac,
+                "maxfev": 10000,
+                "ftol": 1e-10,
+                "xtol": 1e-10,
+                "gtol": 1e-10,
+            }
+            try:
+                popt, _ = curve_fit(model_func, time, flux, method="lm", **fit_options)
+            except RuntimeError:
+                popt = [np.nan]
+            if not local_lower <= popt[0] <= local_upper:
+                popt, _ = curve_fit(
+                    model_func, time, flux, bounds=([local_lower], [local_upper]), method="trf", **fit_options
+                )
 
             fitted_t0 = popt[0]
             model_flux = model_func(time, fitted_t0)
-            chi2 = np.sum((flux - model_flux) ** 2)
+            chi2 = sum_squared_residuals(flux, model_flux)
 
             if chi2 < min_chi2:
                 min_chi2 = chi2
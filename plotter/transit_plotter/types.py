@@ -1,54 +1,70 @@
 """Type definitions for transit plotter."""
 
 from dataclasses import dataclass
-from typing import TypedDict
+
+# Default parameter values
+DEFAULT_U1 = 0.65
+DEFAULT_U2 = 0.08
+DEFAULT_INC = 89.0
+DEFAULT_ECC = 0.0
+DEFAULT_W = 90.0
+DEFAULT_EXP_TIME = 0.00068113
+DEFAULT_SUPERSAMPLE = 15
 
 
-class TransitParams(TypedDict, total=False):
-    """Parameters extracted from light curve CSV headers."""
+@dataclass(slots=True)
+class TransitParams:
+    """Parameters extracted from light curve CSV headers.
+
+    Fields that are missing from a header keep their default: None for values
+    without a sensible fallback, otherwise the value used for fitting.
+    """
 
     # Orbital parameters
-    Periodo_orbital_d: float
-    Epoca_BJDS: float
-    Inc_planeta_deg: float
-    Semieje_a_R_star: float
-    Radio_Planeta_R_star: float
-    Duracion_d: float
-    ecc: float
-    w_deg: float
+    Periodo_orbital_d: float | None = None
+    Epoca_BJDS: float | None = None
+    Inc_planeta_deg: float = DEFAULT_INC
+    Semieje_a_R_star: float = 8.0
+    Radio_Planeta_R_star: float = 0.1
+    Duracion_d: float = 0.2
+    ecc: float = DEFAULT_ECC
+    w_deg: float = DEFAULT_W
 
     # Stellar parameters
-    R_star_R_sol: float
-    Coeficiente_LD_u1: float
-    Coeficiente_LD_u2: float
-    Teff_star: float
-    logg_star: float
+    R_star_R_sol: float | None = None
+    Coeficiente_LD_u1: float = DEFAULT_U1
+    Coeficiente_LD_u2: float = DEFAULT_U2
+    Teff_star: float | None = None
+    logg_star: float | None = None
 
     # Observation parameters
-    exp_time: float
-    supersample_factor: int
-    Ruido_Sigma: float
-    Tipo_Datos: str
-    Nombre_Objeto: str
+    exp_time: float = DEFAULT_EXP_TIME
+    supersample_factor: int = DEFAULT_SUPERSAMPLE
+    Ruido_Sigma: float | None = None
+    Tipo_Datos: str | None = None
+    Nombre_Objeto: str | None = None
 
     # Ground truth (simulated data only)
-    gt_n_manchas: int
-    gt_tamano_min_mancha: float
-    gt_tamano_max_mancha: float
-    gt_contraste_mancha: float
-    gt_radio_exoluna: float
-    gt_periodo_exoluna: float
-    gt_semieje_exoluna: float
-    gt_amplitud_ttv_dias: float
-    gt_periodo_ttv_orbitas: float
-    gt_fase_ttv_rad: float
+    gt_n_manchas: int | None = None
+    gt_tamano_min_mancha: float | None = None
+    gt_tamano_max_mancha: float | None = None
+    gt_contraste_mancha: float | None = None
+    gt_radio_exoluna: float | None = None
+    gt_periodo_exoluna: float | None = None
+    gt_semieje_exoluna: float | None = None
+    gt_amplitud_ttv_dias: float | None = None
+    gt_periodo_ttv_orbitas: float | None = None
+    gt_fase_ttv_rad: float | None = None
+
+    # Fitting configuration
+    Amplitud_TTV_d: float = 2.0  # Maximum TTV searched around each expected t0
 
     # Fitted parameters (added after global fit)
-    RP_GLOBAL: float
-    A_GLOBAL: float
+    RP_GLOBAL: float | None = None
+    A_GLOBAL: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FittedTransit:
     """Result of fitting a single transit."""
 
@@ -63,13 +79,3 @@ class FittedTransit:
     w: float
     exp_time: float
     supersample_factor: int
-
-
-# Default parameter values
-DEFAULT_U1 = 0.65
-DEFAULT_U2 = 0.08
-DEFAULT_INC = 89.0
-DEFAULT_ECC = 0.0
-DEFAULT_W = 90.0
-DEFAULT_EXP_TIME = 0.00068113
-DEFAULT_SUPERSAMPLE = 15